@@ -0,0 +1,219 @@
+# Name: Josue Bustamante
+# OSU Email: bustamjo@oregonstate.edu
+# Course: CS261 - Data Structures
+# Description: An ApproximateBag with the add/count/size interface of Bag
+#              that stores counts in a count-min sketch: depth rows of width
+#              counters kept in a single typed DynamicArray. Memory stays
+#              fixed however many values are added. Counts are never too
+#              low, and with width w and depth d a count is too high by more
+#              than (e / w) * size() with probability at most e^-d. Values
+#              are hashed with blake2b over a canonical encoding, so
+#              sketches built in different processes with the same width and
+#              depth can be merged. Values may be None, bool, int, float,
+#              str, bytes or tuples of these; equal numbers (1, 1.0, True)
+#              count as the same value.
+
+
+import math
+from hashlib import blake2b
+from itertools import repeat
+
+from dynamic_array import *
+
+
+def _key(value: object) -> bytes:
+    """
+    Takes a value as a parameter and returns the bytes it is hashed from,
+    the same in every process. Numbers equal to an integer are encoded as
+    that integer. Unsupported types raise DynamicArrayException.
+    """
+    if value is None:
+        return b'n'
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, int):
+        return b'i' + str(int(value)).encode()
+    if isinstance(value, float):
+        return b'f' + repr(value).encode()
+    if isinstance(value, str):
+        return b's' + value.encode('utf-8', 'surrogatepass')
+    if isinstance(value, bytes):
+        return b'b' + value
+    if isinstance(value, tuple):
+        # PREFIXES each item with its length so nesting is unambiguous
+        parts = [b't']
+        for item in value:
+            item_key = _key(item)
+            parts.append(len(item_key).to_bytes(8, 'little') + item_key)
+        return b''.join(parts)
+    raise DynamicArrayException
+
+
+class ApproximateBag:
+    def __init__(self, start_bag=None, width: int = 2048, depth: int = 4):
+        """
+        Init new approximate bag with depth rows of width counters,
+        adding the values of start_bag (if provided)
+        """
+        if width <= 0 or depth <= 0:
+            raise DynamicArrayException
+
+        self._width = width
+        self._depth = depth
+        self._size = 0
+        self._table = DynamicArray.from_sized(repeat(0, width * depth),
+                                              width * depth, 'q')
+
+        if start_bag is not None:
+            for value in start_bag:
+                self.add(value)
+
+    @classmethod
+    def from_error(cls, epsilon: float, delta: float,
+                   start_bag=None) -> "ApproximateBag":
+        """
+        Takes an error rate epsilon and a failure probability delta as
+        parameters and returns an approximate bag whose counts are too
+        high by more than epsilon * size() with probability at most delta.
+        """
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise DynamicArrayException
+        return cls(start_bag, math.ceil(math.e / epsilon),
+                   math.ceil(math.log(1 / delta)))
+
+    def __str__(self) -> str:
+        """
+        Return content of the bag in human-readable form
+        """
+        return "APPROX_BAG: " + str(self._size) + " elements. [" + \
+            str(self._width) + " x " + str(self._depth) + " counters]"
+
+    def size(self) -> int:
+        """
+        Return total number of items added to the bag
+        """
+        return self._size
+
+    def get_width(self) -> int:
+        """
+        Returns the number of counters in each row.
+        """
+        return self._width
+
+    def get_depth(self) -> int:
+        """
+        Returns the number of rows.
+        """
+        return self._depth
+
+    def error_bound(self) -> float:
+        """
+        Returns the amount, (e / width) * size(), that a count exceeds the
+        true count by at most, with probability 1 - e^-depth.
+        """
+        return math.e / self._width * self._size
+
+    # -----------------------------------------------------------------------
+
+    def _slots(self, value: object):
+        """
+        Takes a value as a parameter and returns its counter index in each
+        row, derived from two halves of a blake2b digest (double hashing).
+        """
+        digest = blake2b(_key(value), digest_size=16).digest()
+        hash_1 = int.from_bytes(digest[:8], 'little')
+        hash_2 = int.from_bytes(digest[8:], 'little') | 1
+        return [row * self._width + (hash_1 + row * hash_2) % self._width
+                for row in range(self._depth)]
+
+    def add(self, value: object, count: int = 1) -> None:
+        """
+        Takes a value and an optional number of instances as parameters
+        and adds that many instances of the value to the bag. Values of
+        unsupported types raise DynamicArrayException.
+        """
+        if count < 0:
+            raise DynamicArrayException
+
+        for index in self._slots(value):
+            self._table[index] += count
+        self._size += count
+
+    def count(self, value: object) -> int:
+        """
+        Takes a value as a parameter and returns an estimate of the amount
+        of instances of that value in the bag. The estimate is never lower
+        than the true count.
+        """
+        return min(self._table[index] for index in self._slots(value))
+
+    def clear(self) -> None:
+        """
+        Clears the bag, keeping its width and depth.
+        """
+        size = self._width * self._depth
+        self._table = DynamicArray.from_sized(repeat(0, size), size, 'q')
+        self._size = 0
+
+    def merge(self, second_bag: "ApproximateBag") -> None:
+        """
+        Takes a second approximate bag with the same width and depth as a
+        parameter and adds its counts to this bag, as if its values had
+        been added here.
+        """
+        if self._width != second_bag._width \
+                or self._depth != second_bag._depth:
+            raise DynamicArrayException
+
+        counters = self._table.as_memoryview()
+        for index, count in enumerate(second_bag._table.as_memoryview()):
+            counters[index] += count
+        counters.release()
+        self._size += second_bag._size
+
+
+def _count_words(words: list) -> ApproximateBag:
+    """
+    Builds the sketch of one block of words in a worker process.
+    """
+    return ApproximateBag(words, 512, 4)
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    print("\n# approximate bag example 1")
+    bag = ApproximateBag([1, 2, 3, 1, 2, 2], width=64, depth=3)
+    print(bag, bag.count(1), bag.count(2), bag.count(3), bag.count(4))
+    bag.add('event', 1000)
+    print(bag.size(), bag.count('event'), round(bag.error_bound(), 2))
+    print(bag.count(1.0), bag.count(True), bag.count('1'), bag.count(2.5))
+    bag.add((1, 'a'))
+    print(bag.count((1.0, 'a')), bag.count((1, 'a', None)))
+    try:
+        bag.add({1, 2})
+    except Exception as e:
+        print("Exception raised:", type(e))
+
+    print("\n# approximate bag example 2")
+    bag = ApproximateBag.from_error(0.001, 0.01)
+    for value in range(100000):
+        bag.add(value % 1000)
+    print(bag, bag.count(7), bag.count(-1) <= bag.error_bound())
+
+    print("\n# merge example 1")
+    words = ("to be or not to be that is the question " * 50).split()
+    with ProcessPoolExecutor(2) as pool:
+        parts = list(pool.map(_count_words, [words[:250], words[250:]]))
+    total = ApproximateBag(width=512, depth=4)
+    for part in parts:
+        total.merge(part)
+    print(total, total.count('to'), total.count('question'))
+    try:
+        total.merge(ApproximateBag())
+    except Exception as e:
+        print("Exception raised:", type(e))
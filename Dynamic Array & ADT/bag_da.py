@@ -5,25 +5,34 @@
 # Due Date: 4/29/2024
 # Description: Methods to implement a Bag class. Features include
 #              adding, removing, and counting elements, clearing the array,
-#              determining equality, and implementing iteration.
+#              determining equality, and implementing iteration. Removing
+#              moves the last element into the gap instead of shifting.
+#              An indexed bag also keeps the indices of each value in a
+#              dictionary, so counting, removing and comparing bags do not
+#              scan the array.
 
 
+from heapq import nlargest
+from itertools import chain, repeat
+
 from dynamic_array import *
 
 
 class Bag:
-    def __init__(self, start_bag=None):
+    def __init__(self, start_bag=None, indexed: bool = False):
         """
-        Init new bag based on Dynamic Array
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Init new bag based on Dynamic Array. With indexed=True the bag
+        also keeps a dictionary from each value to the set of indices
+        holding it (values must be hashable).
         """
         self._da = DynamicArray()
+        self._index = {} if indexed else None
 
         # populate bag with initial values (if provided)
-        # before using this feature, implement add() method
         if start_bag is not None:
-            for value in start_bag:
-                self.add(value)
+            self._da.extend(start_bag)
+            if indexed:
+                self._reindex()
 
     def __str__(self) -> str:
         """
@@ -44,32 +53,115 @@ class Bag:
 
     # -----------------------------------------------------------------------
 
+    def is_indexed(self) -> bool:
+        """
+        Returns True if the bag keeps an index of its values, False
+        otherwise.
+        """
+        return self._index is not None
+
+    def _reindex(self) -> None:
+        """
+        Rebuilds the index of an indexed bag from its array.
+        """
+        self._index = {}
+        for index, value in enumerate(self._da):
+            self._index.setdefault(value, set()).add(index)
+
     def add(self, value: object) -> None:
         """
         Takes a value as a parameter and adds that value to
         the bag array.
         """
+        if self._index is not None:
+            self._index.setdefault(value, set()).add(self._da.length())
         self._da.append(value)
 
+    def _pop_index(self, index: int) -> None:
+        """
+        Takes an index as a parameter and removes the element there by
+        moving the last element into its place, so nothing is shifted.
+        """
+        last = self._da.length() - 1
+        if index != last:
+            moved = self._da[last]
+            self._da[index] = moved
+            if self._index is not None:
+                positions = self._index[moved]
+                positions.remove(last)
+                positions.add(index)
+        self._da.remove_at_index(last)
+
     def remove(self, value: object) -> bool:
         """
         Takes a value as a parameter and returns True if it's possible
         to remove an instance of that value from teh bag array, returning
-        False otherwise
+        False otherwise. The last element takes the place of the removed
+        one.
         """
-        result = None
+        # FINDS the element through the index without searching
+        if self._index is not None:
+            positions = self._index.get(value)
+            if positions is None:
+                return False
+            index = positions.pop()
+            if len(positions) == 0:
+                del self._index[value]
+            self._pop_index(index)
+            return True
+
         for index in range(self.size()):
-            if self._da[index] == value and result is None:
-                self._da.remove_at_index(index)
+            if self._da[index] == value:
+                self._pop_index(index)
                 return True
 
         return False
 
+    def remove_where(self, predicate) -> int:
+        """
+        Takes a predicate as a parameter and removes every element of the
+        bag it returns True for in a single pass, returning the number of
+        elements removed.
+        """
+        removed = self._da.remove_where(predicate)
+        if self._index is not None and removed > 0:
+            self._reindex()
+        return removed
+
+    def remove_all(self, value: object) -> int:
+        """
+        Takes a value as a parameter, removes every instance of it in a
+        single pass and returns the number removed.
+        """
+        if self._index is not None and value not in self._index:
+            return 0
+        return self.remove_where(lambda x: x == value)
+
+    def discard_many(self, values) -> int:
+        """
+        Takes an iterable of values as a parameter and removes one
+        instance of the bag for each of them, ignoring values the bag
+        has run out of, in a single pass. Returns the number removed.
+        """
+        wanted = {}
+        for value in values:
+            wanted[value] = wanted.get(value, 0) + 1
+
+        def discarded(value: object) -> bool:
+            if wanted.get(value, 0) > 0:
+                wanted[value] -= 1
+                return True
+            return False
+        return self.remove_where(discarded)
+
     def count(self, value: object) -> int:
         """
         Takes a value as a parameter and returns the amount of instances
         that value is found in the bag array.
         """
+        if self._index is not None:
+            return len(self._index.get(value, ()))
+
         count = 0
         for index in range(self.size()):
             if self._da[index] == value:
@@ -81,6 +173,8 @@ class Bag:
         Clears the bag array to a size of 0.
         """
         self._da = DynamicArray()
+        if self._index is not None:
+            self._index = {}
 
     def equal(self, second_bag: "Bag") -> bool:
         """
@@ -97,6 +191,10 @@ class Bag:
         if self.size() == 0 and second_bag.size() == 0:
             return True
 
+        # COMPARES the value counts of the bags if either is indexed
+        if self._index is not None or second_bag._index is not None:
+            return self._multiset() == second_bag._multiset()
+
         # COUNTS instances of each element in one array and compares it to the other
         for index in range(self.size()):
             num = self._da[index]
@@ -107,24 +205,88 @@ class Bag:
 
         return True
 
-    def __iter__(self):
+    def _multiset(self) -> dict:
+        """
+        Returns a value -> count dictionary for the bag, using the index
+        if the bag has one.
+        """
+        if self._index is not None:
+            return {value: len(positions)
+                    for value, positions in self._index.items()}
+
+        counts = {}
+        for value in self._da:
+            counts[value] = counts.get(value, 0) + 1
+        return counts
+
+    def _combine(self, second_bag: "Bag", combine) -> "Bag":
+        """
+        Takes a second bag and a function of two counts as parameters and
+        returns a new bag holding each value of either bag as many times
+        as the function gives for its counts in the two bags. The result
+        is indexed if either bag is.
+        """
+        counts_1 = self._multiset()
+        counts_2 = second_bag._multiset()
+        values = []
+        for value in dict.fromkeys(chain(counts_1, counts_2)):
+            count = combine(counts_1.get(value, 0), counts_2.get(value, 0))
+            values.extend(repeat(value, count))
+        return Bag(values, self._index is not None
+                   or second_bag._index is not None)
+
+    def union(self, second_bag: "Bag") -> "Bag":
+        """
+        Takes a second bag as a parameter and returns a new bag with each
+        value as many times as the bag holding more of it.
+        """
+        return self._combine(second_bag, max)
+
+    def intersection(self, second_bag: "Bag") -> "Bag":
         """
-        Creates iterator for loop.
+        Takes a second bag as a parameter and returns a new bag with each
+        value as many times as the bag holding fewer of it.
         """
-        self._index = 0
-        return self
+        return self._combine(second_bag, min)
 
-    def __next__(self):
+    def difference(self, second_bag: "Bag") -> "Bag":
         """
-        Advances iterator by moving to the next index.
+        Takes a second bag as a parameter and returns a new bag with the
+        instances of this bag that are left after removing one for each
+        instance in the second bag.
         """
-        try:
-            value = self._da[self._index]
-        except DynamicArrayException:
-            raise StopIteration
+        return self._combine(second_bag, lambda x, y: max(0, x - y))
 
-        self._index = self._index + 1
-        return value
+    def sum(self, second_bag: "Bag") -> "Bag":
+        """
+        Takes a second bag as a parameter and returns a new bag with the
+        instances of both bags.
+        """
+        return self._combine(second_bag, lambda x, y: x + y)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __add__ = sum
+
+    def most_common(self, k: int) -> DynamicArray:
+        """
+        Takes a number k as a parameter and returns a dynamic array of
+        (value, count) tuples for the k most frequent values, most
+        frequent first. Only k entries are kept while selecting them.
+        """
+        top = DynamicArray()
+        for value, count in nlargest(k, self._multiset().items(),
+                                     key=lambda x: x[1]):
+            top.append((value, count))
+        return top
+
+    def __iter__(self):
+        """
+        Creates a new iterator for loop, independent of any other loop
+        over the same bag.
+        """
+        return iter(self._da)
 
 
 # ------------------- BASIC TESTING -----------------------------------------
@@ -188,3 +350,40 @@ if __name__ == "__main__":
     print(bag)
     for item in bag:
         print(item)
+
+    print("\n# remove_where example 1")
+    bag = Bag([1, 2, 3, 1, 2, 3, 1, 2, 3])
+    print(bag.remove_where(lambda x: x != 2), bag)
+
+    print("\n# __iter__() example 3")
+    bag = Bag([1, 2])
+    print([(x, y) for x in bag for y in bag])
+
+    print("\n# indexed example 1")
+    bag = Bag([1, 2, 3, 1, 2, 2], indexed=True)
+    print(bag, bag.count(1), bag.count(2), bag.count(4))
+    print(bag.remove(4), bag.remove(2), bag.count(2), bag)
+    print(bag.remove_where(lambda x: x == 1), bag.count(1), bag)
+    print(bag.equal(Bag([2, 3, 2])), bag.equal(Bag([2, 3, 3], indexed=True)))
+    bag.clear()
+    bag.add(5)
+    print(bag, bag.count(5), bag.is_indexed())
+
+    print("\n# remove_all, discard_many example 1")
+    for indexed in [False, True]:
+        bag = Bag([1, 2, 3, 1, 2, 3, 1, 2, 3], indexed)
+        print(bag.remove_all(3), bag.remove_all(7), bag)
+        print(bag.discard_many([1, 2, 2, 2, 2, 5]), bag, bag.count(1))
+
+    print("\n# multiset example 1")
+    bag1 = Bag(['a', 'b', 'b', 'c', 'c', 'c'])
+    bag2 = Bag(['b', 'c', 'd', 'd'], indexed=True)
+    print(bag1 | bag2)
+    print(bag1 & bag2)
+    print(bag1 - bag2, bag2 - bag1)
+    print(bag1 + bag2)
+    print(bag1.union(bag2).equal(bag2.union(bag1)), (bag1 + bag2).is_indexed())
+
+    print("\n# most_common example 1")
+    bag = Bag("abracadabra")
+    print(bag.most_common(2), bag.most_common(10).length())
@@ -5,12 +5,34 @@
 # Due Date:4/29/2024
 # Description: Methods for implementing a DynamicArray class with features
 #              including resizing, appending, inserting, removing, slicing,
-#              mapping, filtering, and reducing.
+#              mapping, filtering, and reducing. Arrays can optionally
+#              store numbers in a compact typed buffer instead of a
+#              StaticArray of Python objects.
 
 
+import pickle
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, reduce as _reduce
+from heapq import heappush, heapreplace, nlargest
+from itertools import chain, islice
+
 from static_array import StaticArray
 
 
+# typecodes (see the array module) accepted by the compact storage mode
+TYPECODES = 'bBhHiIlLqQfd'
+
+# saved file header: magic, typecode ('O' for objects), byte order of the
+# raw elements, size in bytes of one element (0 for objects), padding,
+# number of elements
+FILE_HEADER = struct.Struct('<4sccBxQ')
+FILE_MAGIC = b'DYNA'
+BYTE_ORDER = b'<' if sys.byteorder == 'little' else b'>'
+
+
 class DynamicArrayException(Exception):
     """
     Custom exception class to be used by Dynamic Array
@@ -19,285 +41,1587 @@ class DynamicArrayException(Exception):
     pass
 
 
-class DynamicArray:
-    def __init__(self, start_array=None):
+class ResizePolicy:
+    def __init__(self, growth_factor: float = 2, shrink_threshold: float = 0.25,
+                 min_capacity: int = 10, hysteresis: float = 0) -> None:
+        """
+        Init a resize policy for DynamicArray
+        growth_factor: capacity multiplier applied when the array is full
+        shrink_threshold: the array shrinks once its size falls under this
+                          fraction of its capacity
+        min_capacity: the array never shrinks to a smaller capacity, and
+                      arrays at or under it never shrink at all
+        hysteresis: fraction (0 <= h < 1) that lowers the shrink trigger to
+                    threshold * (1 - h) and leaves (1 + h) times the usual
+                    room after shrinking, so sizes oscillating around the
+                    threshold do not resize back and forth
+        The defaults reproduce the original double / quarter-shrink rule.
+        """
+        if growth_factor <= 1 or not 0 <= shrink_threshold < 1:
+            raise DynamicArrayException
+        if min_capacity < 1 or not 0 <= hysteresis < 1:
+            raise DynamicArrayException
+
+        self._growth_factor = growth_factor
+        self._shrink_threshold = shrink_threshold
+        self._min_capacity = min_capacity
+        self._hysteresis = hysteresis
+
+    def grow(self, capacity: int) -> int:
+        """
+        Takes a full array's capacity as a parameter and returns the
+        capacity to grow it to.
+        """
+        return max(capacity + 1, int(capacity * self._growth_factor))
+
+    def shrink(self, size: int, capacity: int) -> int:
+        """
+        Takes an array's size and capacity as parameters and returns the
+        capacity to shrink it to, or None if it should keep its capacity.
+        """
+        if capacity <= self._min_capacity:
+            return None
+
+        trigger = capacity * self._shrink_threshold * (1 - self._hysteresis)
+        if size >= trigger:
+            return None
+
+        room = size * self._growth_factor * (1 + self._hysteresis)
+        return max(self._min_capacity, size, int(room))
+
+
+class ResizeStats:
+    def __init__(self) -> None:
+        """
+        Init resize counters for a DynamicArray
+        """
+        self.resizes = 0
+        self.elements_copied = 0
+        self.peak_capacity = 0
+
+    def __str__(self) -> str:
+        """
+        Return the counters in human-readable form
+        """
+        return (f"Resizes: {self.resizes}, Copied: {self.elements_copied}, "
+                f"Peak capacity: {self.peak_capacity}")
+
+    def record(self, capacity: int, copied: int) -> None:
+        """
+        Takes a new capacity and the number of elements copied as
+        parameters and counts one resize.
+        """
+        self.resizes += 1
+        self.elements_copied += copied
+        self.peak_capacity = max(self.peak_capacity, capacity)
+
+
+DEFAULT_POLICY = ResizePolicy()
+
+
+class DynamicArray:
+    def __init__(self, start_array=None, typecode: str = None,
+                 policy: ResizePolicy = None):
+        """
+        Initialize new dynamic array
+        A typecode from TYPECODES stores the elements in a compact typed
+        buffer instead of a StaticArray of Python objects
+        A ResizePolicy replaces the default growth and shrink rules
+        """
+        if typecode is not None and typecode not in TYPECODES:
+            raise DynamicArrayException
+
+        self._size = 0
+        self._capacity = 4
+        self._typecode = typecode
+        self._policy = policy if policy is not None else DEFAULT_POLICY
+        self._stats = ResizeStats()
+        self._stats.peak_capacity = self._capacity
+        self._data = self._new_storage(self._capacity)
+
+        # populate dynamic array with initial values (if provided)
+        if start_array is not None:
+            self.extend(start_array)
+
+    @classmethod
+    def from_sized(cls, values, n: int, typecode: str = None,
+                   policy: ResizePolicy = None) -> "DynamicArray":
+        """
+        Takes an iterable and the number of values it will produce as
+        parameters and returns a new dynamic array holding those values.
+        Capacity for n values is allocated once before filling; an
+        iterable producing more values than n still grows as needed.
+        """
+        new_arr = cls(typecode=typecode, policy=policy)
+        new_arr._reserve(n)
+        new_arr._fill(values)
+        return new_arr
+
+    def __str__(self) -> str:
+        """
+        Return content of dynamic array in human-readable form
+        DO NOT CHANGE THIS METHOD IN ANY WAY
+        """
+        out = "DYN_ARR Size/Cap: "
+        out += str(self._size) + "/" + str(self._capacity) + ' ['
+        out += ', '.join([str(self._data[_]) for _ in range(self._size)])
+        return out + ']'
+
+    def __iter__(self):
+        """
+        Create a new iterator for loop, so nested loops over the same
+        array are independent. Each step reads the element at the current
+        position, so changes made during the loop are seen and the loop
+        stops at the current end of the array.
+        """
+        index = 0
+        while index < self._size:
+            yield self._data[self._slot(index)]
+            index += 1
+
+    def __reversed__(self):
+        """
+        Create a new iterator over the elements from last to first. Like
+        __iter__(), it stops early if elements are removed during the loop.
+        """
+        index = self._size
+        while True:
+            index = min(index, self._size) - 1
+            if index < 0:
+                return
+            yield self._data[self._slot(index)]
+
+    def get_at_index(self, index: int) -> object:
+        """
+        Return value from given index position
+        Invalid index raises DynamicArrayException
+        DO NOT CHANGE THIS METHOD IN ANY WAY
+        """
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+        return self._data[index]
+
+    def set_at_index(self, index: int, value: object) -> None:
+        """
+        Store value at given index in the array
+        Invalid index raises DynamicArrayException
+        DO NOT CHANGE THIS METHOD IN ANY WAY
+        """
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+        self._data[index] = value
+
+    def __getitem__(self, index) -> object:
+        """
+        Same functionality as get_at_index() method above,
+        but called using array[index] syntax
+        DO NOT CHANGE THIS METHOD IN ANY WAY
+        """
+        return self.get_at_index(index)
+
+    def __setitem__(self, index, value) -> None:
+        """
+        Same functionality as set_at_index() method above,
+        but called using array[index] syntax
+        DO NOT CHANGE THIS METHOD IN ANY WAY
+        """
+        self.set_at_index(index, value)
+
+    def is_empty(self) -> bool:
+        """
+        Return True is array is empty / False otherwise
+        DO NOT CHANGE THIS METHOD IN ANY WAY
+        """
+        return self._size == 0
+
+    def length(self) -> int:
+        """
+        Return number of elements stored in array
+        DO NOT CHANGE THIS METHOD IN ANY WAY
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return the capacity of the array
+        DO NOT CHANGE THIS METHOD IN ANY WAY
+        """
+        return self._capacity
+
+    def print_da_variables(self) -> None:
+        """
+        Print information contained in the dynamic array.
+        Used for testing purposes.
+        DO NOT CHANGE THIS METHOD IN ANY WAY
+        """
+        print(f"Length: {self._size}, Capacity: {self._capacity}, {self._data}")
+
+    # -----------------------------------------------------------------------
+
+    def get_policy(self) -> ResizePolicy:
+        """
+        Returns the resize policy of the array.
+        """
+        return self._policy
+
+    def get_resize_stats(self) -> ResizeStats:
+        """
+        Returns the live resize counters of the array.
+        """
+        return self._stats
+
+    def get_typecode(self) -> str:
+        """
+        Returns the typecode of the compact storage, or None if the
+        array stores Python objects.
+        """
+        return self._typecode
+
+    def as_memoryview(self) -> memoryview:
+        """
+        Returns a memoryview over the elements of a typed array without
+        copying them. Object arrays raise DynamicArrayException.
+        The view is only valid until the array is next resized.
+        """
+        if self._typecode is None:
+            raise DynamicArrayException
+        return memoryview(self._data)[:self._size]
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Exposes the buffer protocol for typed arrays (Python 3.12+)
+        """
+        return self.as_memoryview()
+
+    def save(self, path: str) -> None:
+        """
+        Takes a file path as a parameter and writes the array to it: a
+        FILE_HEADER followed by the raw element buffer of a typed array,
+        or by a pickled list of the elements of an object array.
+        """
+        typecode = self._typecode if self._typecode is not None else 'O'
+        with open(path, 'wb') as file:
+            file.write(pack_file_header(typecode, self._size))
+            if self._typecode is not None:
+                file.write(self.as_memoryview())
+            else:
+                pickle.dump(list(self._values()), file,
+                            pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str, policy: "ResizePolicy" = None) -> "DynamicArray":
+        """
+        Takes the path of a file written by save() as a parameter and
+        returns a new array holding its elements. Typed elements are read
+        as one block; files saved on a machine with the other byte order
+        are byte-swapped. Files whose elements have a different size on
+        this machine, or that are truncated, raise DynamicArrayException.
+        """
+        with open(path, 'rb') as file:
+            typecode, byte_order, size = read_file_header(file)
+            try:
+                if typecode == 'O':
+                    return cls(pickle.load(file), None, policy)
+
+                values = array(typecode)
+                values.fromfile(file, size)
+            except (EOFError, ValueError, pickle.UnpicklingError):
+                raise DynamicArrayException
+
+        if byte_order != BYTE_ORDER:
+            values.byteswap()
+        new_arr = cls(typecode=typecode, policy=policy)
+        new_arr._fill(values)
+        return new_arr
+
+    def __reduce_ex__(self, protocol: int):
+        """
+        Pickle support. Typed arrays pickle their raw buffer, which
+        protocol 5 can hand out of band; object arrays pickle a list of
+        their elements. Neither side loops over the elements in Python.
+        """
+        return self._reduce_as(type(self), protocol)
+
+    def _reduce_as(self, cls, protocol: int) -> tuple:
+        """
+        Takes the class to rebuild as and a pickle protocol as parameters
+        and returns the reduce tuple for __reduce_ex__().
+        """
+        if self._typecode is None:
+            return cls, (list(self._values()), None, self._policy)
+
+        if protocol >= 5:
+            buffer = pickle.PickleBuffer(self.as_memoryview())
+        else:
+            buffer = self.as_memoryview().tobytes()
+        return _rebuild, (cls, self._typecode, buffer, self._policy)
+
+    def _new_storage(self, capacity: int):
+        """
+        Takes a capacity as a parameter and returns empty backing storage
+        of that capacity for the array's storage mode.
+        """
+        if self._typecode is None:
+            return StaticArray(capacity)
+        return array(self._typecode, [0]) * capacity
+
+    def _block(self, start_index: int = 0, size: int = None) -> array:
+        """
+        Takes a start index and a size as parameters and returns a copy of
+        that block of a typed array's storage (a single memory copy).
+        """
+        if size is None:
+            size = self._size - start_index
+        return self._data[start_index:start_index + size]
+
+    def _capacity_for(self, required: int) -> int:
+        """
+        Takes a required number of elements as a parameter and returns the
+        capacity repeated growth would reach to hold them.
+        """
+        capacity = self._capacity
+        while capacity < required:
+            capacity = self._policy.grow(capacity)
+        return capacity
+
+    def _reserve(self, required: int) -> None:
+        """
+        Takes a required number of elements as a parameter and resizes
+        the array once so that they fit.
+        """
+        capacity = self._capacity_for(required)
+        if capacity != self._capacity:
+            self.resize(capacity)
+
+    def _fill(self, values) -> None:
+        """
+        Takes an iterable as a parameter and writes its values after the
+        last element, growing only when the reserved capacity runs out.
+        """
+        if self._typecode is not None:
+            if isinstance(values, DynamicArray) \
+                    and values._typecode == self._typecode:
+                block = values._block()
+            elif isinstance(values, array) \
+                    and values.typecode == self._typecode:
+                block = values
+            else:
+                block = array(self._typecode, values)
+            self._reserve(self._size + len(block))
+            self._data[self._size:self._size + len(block)] = block
+            self._size += len(block)
+            return
+
+        for value in values:
+            if self._size >= self._capacity:
+                self.resize(self._policy.grow(self._capacity))
+            self._data[self._size] = value
+            self._size += 1
+
+    def _slot(self, index: int) -> int:
+        """
+        Takes a logical index as a parameter and returns the position of
+        that element in the backing storage.
+        """
+        return index
+
+    def _values(self, start_index: int = 0, size: int = None):
+        """
+        Takes a start index and a size as parameters and returns an
+        iterable over that block of elements without copying it.
+        """
+        if size is None:
+            size = self._size - start_index
+        if self._typecode is not None:
+            return memoryview(self._data)[start_index:start_index + size]
+        return (self._data[index]
+                for index in range(start_index, start_index + size))
+
+    def _wrap(self, values: array) -> "DynamicArray":
+        """
+        Takes a typed array of values as a parameter and returns a new
+        dynamic array that adopts it as storage, with the capacity that
+        appending the values one by one would have reached.
+        """
+        size = len(values)
+        new_arr = DynamicArray(typecode=values.typecode, policy=self._policy)
+        capacity = new_arr._capacity_for(size)
+
+        # PADS values out to capacity in place
+        values += array(values.typecode, [0]) * (capacity - size)
+        new_arr._data = values
+        new_arr._size = size
+        new_arr._capacity = capacity
+        new_arr._stats.peak_capacity = capacity
+        return new_arr
+
+    def resize(self, new_capacity: int) -> None:
+        """
+        Takes an integer as a parameter and resizes the array to the new
+        capacity if it is not smaller than the current size.
+        """
+        if new_capacity <= 0:
+            return None
+
+        if new_capacity < self._size:
+            return None
+
+        old_arr = self._data
+        self._data = self._new_storage(new_capacity)
+        self._capacity = new_capacity
+
+        # COPIES typed elements as a single block
+        if self._typecode is not None:
+            self._data[:self._size] = old_arr[:self._size]
+            self._stats.record(new_capacity, self._size)
+            return None
+
+        # SETS elements to fresh larger array
+        if new_capacity > old_arr.length():
+            for index in range(old_arr.length()):
+                self._data.set(index, old_arr.get(index))
+            self._stats.record(new_capacity, old_arr.length())
+        else:
+            # SETS elements to fresh smaller array
+            for index in range(new_capacity):
+                self._data.set(index, old_arr.get(index))
+            self._stats.record(new_capacity, new_capacity)
+
+    def append(self, value: object) -> None:
+        """
+        Takes a value as a parameter and adds it to the end of the
+        elements in the list.
+        """
+        # GROWS array capacity if reached
+        if self._size >= self._capacity:
+            self.resize(self._policy.grow(self._capacity))
+
+        # APPENDS value
+        self._data[self._size] = value
+        self._size += 1
+
+    def extend(self, values) -> None:
+        """
+        Takes an iterable as a parameter and appends all of its values
+        to the end of the array, resizing at most once for sized input.
+        """
+        # SNAPSHOTS the array when extending it with itself
+        if values is self:
+            values = self.slice(0, self._size) if self._size else []
+
+        if isinstance(values, DynamicArray):
+            count = values.length()
+        else:
+            try:
+                count = len(values)
+            except TypeError:
+                values = list(values)
+                count = len(values)
+
+        self._reserve(self._size + count)
+        self._fill(values)
+
+    def insert_at_index(self, index: int, value: object) -> None:
+        """
+        Takes an index and a value as parameters and inserts the value
+        at the index specified.
+        """
+        # GROWS capacity if reached
+        if self._size >= self._capacity:
+            self.resize(self._policy.grow(self._capacity))
+
+        # RAISES exception if index is invalid
+        if index > self._size or index < 0:
+            raise DynamicArrayException
+
+        # MOVES elements to allow for new value
+        if self._typecode is not None:
+            self._data[index + 1:self._size + 1] = self._block(index)
+        else:
+            count = self._size - 1
+            for val in range(index, self.length()):
+                self._data.set(count + 1, self._data.get(count))
+                count -= 1
+
+        # INSERTS value into place
+        self._data[index] = value
+        self._size += 1
+
+    def remove_at_index(self, index: int) -> None:
+        """
+        Takes an index as a parameter and removes the element of the
+        array found at the index specified.
+        """
+        # RAISES exception if index is invalid
+        if index > self._size - 1 or index < 0:
+            raise DynamicArrayException
+
+        self._shrink()
+
+        # MOVES elements to occupy the empty space
+        if self._typecode is not None:
+            self._data[index:self._size - 1] = self._block(index + 1)
+        else:
+            for val in range(index, self._size - 1):
+                self._data[val] = self._data[val + 1]
+                self._data[val + 1] = None
+
+        self._size -= 1
+
+    def _shrink(self) -> None:
+        """
+        Resizes the array if its policy's shrink rule applies (by default
+        when it is under 25% capacity).
+        """
+        new_capacity = self._policy.shrink(self._size, self._capacity)
+        if new_capacity is not None and new_capacity < self._capacity:
+            self.resize(new_capacity)
+
+    def _truncate(self, new_size: int) -> None:
+        """
+        Takes a new size as a parameter, drops the elements past it and
+        applies the shrink rule once for the whole removal.
+        """
+        if self._typecode is None:
+            for index in range(new_size, self._size):
+                self._data[index] = None
+        self._size = new_size
+        self._shrink()
+
+    def remove_where(self, predicate) -> int:
+        """
+        Takes a predicate as a parameter and removes every element it
+        returns True for in a single compacting pass, keeping the order of
+        the remaining elements. Returns the number of elements removed.
+        """
+        old_size = self._size
+
+        # COMPACTS kept typed elements as one block
+        if self._typecode is not None:
+            kept = array(self._typecode, [value for value in self._values()
+                                          if predicate(value) is not True])
+            self._data[:len(kept)] = kept
+            self._truncate(len(kept))
+            return old_size - self._size
+
+        # MOVES each kept element down to the next free slot
+        count = 0
+        for index in range(self._size):
+            value = self._data[index]
+            if predicate(value) is not True:
+                self._data[count] = value
+                count += 1
+
+        self._truncate(count)
+        return old_size - self._size
+
+    def remove_indices(self, sorted_indices) -> None:
+        """
+        Takes an iterable of strictly ascending, valid indices as a
+        parameter and removes the elements at those positions in a single
+        compacting pass. Invalid indices raise DynamicArrayException
+        before anything is removed.
+        """
+        indices = list(sorted_indices)
+        previous = -1
+        for index in indices:
+            if index <= previous or index >= self._size:
+                raise DynamicArrayException
+            previous = index
+
+        if not indices:
+            return
+
+        # MOVES each block between removed indices down as one piece
+        count = indices[0]
+        bounds = indices + [self._size]
+        for position in range(len(indices)):
+            start = bounds[position] + 1
+            end = bounds[position + 1]
+            if self._typecode is not None:
+                self._data[count:count + end - start] = self._data[start:end]
+            else:
+                for index in range(start, end):
+                    self._data[count + index - start] = self._data[index]
+            count += end - start
+
+        self._truncate(count)
+
+    def slice(self, start_index: int, size: int,
+              view: bool = False) -> "DynamicArray":
+        """
+        Takes a starting index and a size as parameters and returns
+        a new array of the size specified, made from the elements
+        of the original array starting from the index specified.
+        With view=True a DynamicArrayView sharing this array's storage
+        is returned instead of a copy.
+        """
+        # RAISES exception if size is invalid
+        if size < 0 or start_index + size > self._size:
+            raise DynamicArrayException
+
+        # RAISES exception if index is invalid
+        if start_index < 0 or start_index >= self._size:
+            raise DynamicArrayException
+
+        if view:
+            return DynamicArrayView(self, start_index, size)
+
+        # COPIES typed elements as a single block
+        if self._typecode is not None:
+            return self._wrap(self._block(start_index, size))
+
+        new_arr = DynamicArray(policy=self._policy)
+
+        # APPENDS elements from old array to new array
+        for value in self._values(start_index, size):
+            new_arr.append(value)
+        return new_arr
+
+    def map(self, map_func, typecode: str = None) -> "DynamicArray":
+        """
+        Takes a map function as a parameter and returns a dynamic array
+        with elements being derived from the map function being applied
+        to the elements of the original array.
+        The result uses the optional typecode, defaulting to the typecode
+        of the original array.
+        """
+        if typecode is None:
+            typecode = self._typecode
+
+        # BUILDS typed result directly from the mapped values
+        if typecode is not None:
+            return self._wrap(array(typecode, map(map_func, self._values())))
+
+        # APPENDS new elements to new array
+        new_arr = DynamicArray(policy=self._policy)
+        for value in self._values():
+            new_arr.append(map_func(value))
+        return new_arr
+
+    def filter(self, filter_func) -> "DynamicArray":
+        """
+        Takes a filter function as a parameter and returns a new
+        dynamic array with the elements filtered as specified
+        from the old array.
+        """
+        # BUILDS typed result directly from the kept values
+        if self._typecode is not None:
+            return self._wrap(array(self._typecode,
+                                    [value for value in self._values()
+                                     if filter_func(value) is True]))
+
+        # APPENDS filtered elements to new array
+        new_arr = DynamicArray(policy=self._policy)
+        for value in self._values():
+            if filter_func(value) is True:
+                new_arr.append(value)
+        return new_arr
+
+    def reduce(self, reduce_func, initializer=None) -> object:
+        """
+        Takes a reduce function and an optional initializer as
+        parameters and returns the value derived from the reduce
+        function
+        """
+        # IF array is empty
+        if self._size == 0:
+            return initializer
+
+        # REDUCES typed elements without indexing each one
+        if self._typecode is not None:
+            if initializer is None:
+                return _reduce(reduce_func, self._values())
+            return _reduce(reduce_func, self._values(), initializer)
+
+        # SETS initializer to first element
+        values = iter(self._values())
+        if initializer is None:
+            initializer = next(values)
+
+        # LOOPS reduce function
+        for value in values:
+            result = reduce_func(initializer, value)
+            initializer = result
+
+        return initializer
+
+    def lazy(self) -> "DynamicArrayPipeline":
+        """
+        Returns a pipeline over the elements of the array whose map and
+        filter stages run fused in a single pass when it is consumed.
+        """
+        return DynamicArrayPipeline(self)
+
+    def _chunks(self, chunk_size: int) -> list:
+        """
+        Takes a chunk size as a parameter and returns the elements split
+        into consecutive blocks of at most that many elements, as typed
+        arrays or lists that can be sent to worker processes.
+        """
+        if chunk_size < 1:
+            raise DynamicArrayException
+
+        blocks = []
+        for start in range(0, self._size, chunk_size):
+            size = min(chunk_size, self._size - start)
+            if self._typecode is not None:
+                blocks.append(self._block(start, size))
+            else:
+                blocks.append(list(self._values(start, size)))
+        return blocks
+
+    def _run_parallel(self, task, blocks: list, executor,
+                      max_workers: int) -> list:
+        """
+        Takes a task, its blocks, and an optional executor as parameters
+        and returns the task's results for each block, in block order.
+        A process pool is created for the call if no executor is given.
+        """
+        if executor is not None:
+            return list(executor.map(task, blocks))
+        with ProcessPoolExecutor(max_workers) as pool:
+            return list(pool.map(task, blocks))
+
+    def parallel_map(self, map_func, chunk_size: int = 10000,
+                     typecode: str = None, executor=None,
+                     max_workers: int = None) -> "DynamicArray":
+        """
+        Same result as map(), but the array is split into blocks of
+        chunk_size elements that are mapped on a process pool.
+        map_func must be picklable (a module-level function, not a lambda).
+        """
+        if typecode is None:
+            typecode = self._typecode
+
+        blocks = self._chunks(chunk_size)
+        results = self._run_parallel(partial(_map_block, map_func, typecode),
+                                     blocks, executor, max_workers)
+        return DynamicArray.from_sized(chain.from_iterable(results),
+                                       self._size, typecode)
+
+    def parallel_filter(self, filter_func, chunk_size: int = 10000,
+                        executor=None,
+                        max_workers: int = None) -> "DynamicArray":
+        """
+        Same result as filter(), but the blocks of chunk_size elements
+        are filtered on a process pool and reassembled in order.
+        filter_func must be picklable.
+        """
+        blocks = self._chunks(chunk_size)
+        results = self._run_parallel(partial(_filter_block, filter_func),
+                                     blocks, executor, max_workers)
+        return DynamicArray(chain.from_iterable(results), self._typecode)
+
+    def parallel_reduce(self, reduce_func, initializer=None,
+                        chunk_size: int = 10000, executor=None,
+                        max_workers: int = None) -> object:
+        """
+        Same result as reduce() for an associative reduce_func: each block
+        of chunk_size elements is reduced on a process pool, then the
+        partial results are combined pairwise in a tree until one is
+        left. reduce_func must be picklable.
+        """
+        if self._size == 0:
+            return initializer
+
+        task = partial(_reduce_block, reduce_func)
+        blocks = self._chunks(chunk_size)
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers)
+            owned = True
+        else:
+            owned = False
+
+        try:
+            partials = self._run_parallel(task, blocks, executor, None)
+
+            # COMBINES neighbouring partial results one tree level at a time
+            while len(partials) > 1:
+                pairs = [partials[index:index + 2]
+                         for index in range(0, len(partials), 2)]
+                partials = self._run_parallel(task, pairs, executor, None)
+        finally:
+            if owned:
+                executor.shutdown()
+
+        if initializer is None:
+            return partials[0]
+        return reduce_func(initializer, partials[0])
+
+    def _sort_order(self, key=None, reverse: bool = False) -> array:
+        """
+        Takes an optional key function and a reverse flag as parameters
+        and returns a typed array of the indices that would sort the
+        array stably. Besides the result it uses one list of the keys
+        and one more index array of the same length as merge buffer.
+        """
+        size = self._size
+        keys = list(self._values() if key is None
+                    else map(key, self._values()))
+
+        # SORTS reversed keys ascending so equal keys keep their order
+        # once the result is turned around
+        if reverse:
+            keys.reverse()
+
+        order = array('q', range(size))
+        bounds = _run_bounds(keys)
+
+        # MERGES neighbouring runs until one is left
+        buffer = array('q', order)
+        while len(bounds) > 2:
+            for index in range(0, len(bounds) - 2, 2):
+                _merge_runs(keys, order, buffer, bounds[index],
+                            bounds[index + 1], bounds[index + 2])
+            unpaired = len(bounds) % 2 == 0
+            if unpaired:
+                buffer[bounds[-2]:] = order[bounds[-2]:]
+            order, buffer = buffer, order
+            bounds = bounds[::2]
+            if unpaired:
+                bounds.append(size)
+
+        if reverse:
+            order.reverse()
+            for index in range(size):
+                order[index] = size - 1 - order[index]
+        return order
+
+    def argsort(self, key=None, reverse: bool = False) -> "DynamicArray":
+        """
+        Takes an optional key function and a reverse flag as parameters
+        and returns a typed array of the indices that would sort the
+        array stably, without moving any elements. The ascending runs
+        that chunk() would return are merged pairwise, so nearly sorted
+        arrays take close to linear time. The keys are held in a list
+        and merged through one extra index array while sorting.
+        """
+        return self._wrap(self._sort_order(key, reverse))
+
+    def sort(self, key=None, reverse: bool = False) -> None:
+        """
+        Takes an optional key function and a reverse flag as parameters
+        and sorts the elements. The sort is stable: elements with equal
+        keys keep their relative order. The elements are moved in place
+        along the cycles of the argsort() order, but like argsort() the
+        sort needs a list of the keys and two index arrays while it runs.
+        """
+        order = self._sort_order(key, reverse)
+
+        # FOLLOWS each cycle of the order, marking visited indices by
+        # storing them negated
+        for start in range(self._size):
+            if order[start] < 0:
+                continue
+            first = self._data[self._slot(start)]
+            index = start
+            while True:
+                source = order[index]
+                order[index] = -1 - source
+                if source == start:
+                    self._data[self._slot(index)] = first
+                    break
+                self._data[self._slot(index)] = self._data[self._slot(source)]
+                index = source
+
+
+class CircularDynamicArray(DynamicArray):
+    def __init__(self, start_array=None, typecode: str = None,
+                 policy: ResizePolicy = None):
+        """
+        Initialize new dynamic array stored as a circular buffer
+        The first element lives at self._front and positions wrap around
+        the end of the storage, so adding or removing at either end moves
+        no other elements. Inserts and removals in the middle shift
+        whichever side of the index is shorter.
+        """
+        self._front = 0
+        super().__init__(start_array, typecode, policy)
+
+    def __str__(self) -> str:
+        """
+        Return content of dynamic array in human-readable form
+        """
+        out = "DYN_ARR Size/Cap: "
+        out += str(self._size) + "/" + str(self._capacity) + ' ['
+        out += ', '.join([str(value) for value in self._values()])
+        return out + ']'
+
+    def get_at_index(self, index: int) -> object:
+        """
+        Return value from given index position
+        Invalid index raises DynamicArrayException
+        """
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+        return self._data[(self._front + index) % self._capacity]
+
+    def set_at_index(self, index: int, value: object) -> None:
+        """
+        Store value at given index in the array
+        Invalid index raises DynamicArrayException
+        """
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+        self._data[(self._front + index) % self._capacity] = value
+
+    def as_memoryview(self) -> memoryview:
+        """
+        Returns a memoryview over the elements of a typed array, first
+        moving them back to the start of the storage if they wrap around.
+        """
+        if self._typecode is None:
+            raise DynamicArrayException
+        if self._front + self._size > self._capacity:
+            self._linearize()
+        return memoryview(self._data)[self._front:self._front + self._size]
+
+    def _slot(self, index: int) -> int:
+        """
+        Takes a logical index as a parameter and returns the position of
+        that element in the circular storage.
+        """
+        return (self._front + index) % self._capacity
+
+    def _linearize(self) -> None:
+        """
+        Moves the elements so that the first one is at position 0.
+        """
+        if self._front != 0:
+            self.resize(self._capacity)
+
+    def _block(self, start_index: int = 0, size: int = None) -> array:
+        """
+        Takes a start index and a size as parameters and returns a copy of
+        that block of a typed array, joining the two pieces if it wraps.
+        """
+        if size is None:
+            size = self._size - start_index
+        start = self._slot(start_index)
+        if start + size <= self._capacity:
+            return self._data[start:start + size]
+        return self._data[start:] + self._data[:start + size - self._capacity]
+
+    def _values(self, start_index: int = 0, size: int = None):
+        """
+        Takes a start index and a size as parameters and returns an
+        iterable over that block of elements without copying it.
+        """
+        if size is None:
+            size = self._size - start_index
+        start = self._slot(start_index)
+        if self._typecode is not None:
+            view = memoryview(self._data)
+            if start + size <= self._capacity:
+                return view[start:start + size]
+            return chain(view[start:], view[:start + size - self._capacity])
+        return (self._data[self._slot(index)]
+                for index in range(start_index, start_index + size))
+
+    def _fill(self, values) -> None:
+        """
+        Takes an iterable as a parameter and writes its values after the
+        last element.
+        """
+        self._linearize()
+        super()._fill(values)
+
+    def resize(self, new_capacity: int) -> None:
+        """
+        Takes an integer as a parameter and resizes the array to the new
+        capacity if it is not smaller than the current size. The elements
+        are copied in order to the start of the new storage.
+        """
+        if new_capacity <= 0 or new_capacity < self._size:
+            return None
+
+        if self._typecode is not None:
+            block = self._block()
+            self._data = self._new_storage(new_capacity)
+            self._data[:self._size] = block
+        else:
+            old_arr = self._data
+            old_front = self._front
+            self._data = self._new_storage(new_capacity)
+            for index in range(self._size):
+                self._data[index] = \
+                    old_arr[(old_front + index) % self._capacity]
+
+        self._capacity = new_capacity
+        self._front = 0
+        self._stats.record(new_capacity, self._size)
+
+    def append(self, value: object) -> None:
+        """
+        Takes a value as a parameter and adds it to the end of the array.
+        """
+        if self._size >= self._capacity:
+            self.resize(self._policy.grow(self._capacity))
+
+        self._data[self._slot(self._size)] = value
+        self._size += 1
+
+    def appendleft(self, value: object) -> None:
+        """
+        Takes a value as a parameter and adds it to the front of the
+        array without moving any other element.
+        """
+        if self._size >= self._capacity:
+            self.resize(self._policy.grow(self._capacity))
+
+        self._front = (self._front - 1) % self._capacity
+        self._data[self._front] = value
+        self._size += 1
+
+    def pop(self) -> object:
+        """
+        Removes the last element of the array and returns it.
+        """
+        if self._size == 0:
+            raise DynamicArrayException
+
+        value = self.get_at_index(self._size - 1)
+        self.remove_at_index(self._size - 1)
+        return value
+
+    def popleft(self) -> object:
+        """
+        Removes the first element of the array and returns it without
+        moving any other element.
+        """
+        if self._size == 0:
+            raise DynamicArrayException
+
+        value = self._data[self._front]
+        self.remove_at_index(0)
+        return value
+
+    def insert_at_index(self, index: int, value: object) -> None:
+        """
+        Takes an index and a value as parameters and inserts the value
+        at the index specified, shifting the shorter side of the array.
+        """
+        if self._size >= self._capacity:
+            self.resize(self._policy.grow(self._capacity))
+
+        # RAISES exception if index is invalid
+        if index > self._size or index < 0:
+            raise DynamicArrayException
+
+        # MOVES the elements before index one slot towards the front
+        if index < self._size - index:
+            self._front = (self._front - 1) % self._capacity
+            for position in range(index):
+                self._data[self._slot(position)] = \
+                    self._data[self._slot(position + 1)]
+
+        # MOVES the elements from index on one slot towards the back
+        else:
+            for position in range(self._size, index, -1):
+                self._data[self._slot(position)] = \
+                    self._data[self._slot(position - 1)]
+
+        self._data[self._slot(index)] = value
+        self._size += 1
+
+    def remove_at_index(self, index: int) -> None:
+        """
+        Takes an index as a parameter and removes the element found at
+        that index, shifting the shorter side of the array.
+        """
+        # RAISES exception if index is invalid
+        if index > self._size - 1 or index < 0:
+            raise DynamicArrayException
+
+        self._shrink()
+        blank = None if self._typecode is None else 0
+
+        # MOVES the elements before index one slot towards the back
+        if index < self._size - 1 - index:
+            for position in range(index, 0, -1):
+                self._data[self._slot(position)] = \
+                    self._data[self._slot(position - 1)]
+            self._data[self._front] = blank
+            self._front = (self._front + 1) % self._capacity
+
+        # MOVES the elements after index one slot towards the front
+        else:
+            for position in range(index, self._size - 1):
+                self._data[self._slot(position)] = \
+                    self._data[self._slot(position + 1)]
+            self._data[self._slot(self._size - 1)] = blank
+
+        self._size -= 1
+
+    def remove_where(self, predicate) -> int:
         """
-        Initialize new dynamic array
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Same as DynamicArray.remove_where(), after moving the elements
+        back to the start of the storage.
         """
-        self._size = 0
-        self._capacity = 4
-        self._data = StaticArray(self._capacity)
+        self._linearize()
+        return super().remove_where(predicate)
 
-        # populate dynamic array with initial values (if provided)
-        # before using this feature, implement append() method
-        if start_array is not None:
-            for value in start_array:
-                self.append(value)
+    def remove_indices(self, sorted_indices) -> None:
+        """
+        Same as DynamicArray.remove_indices(), after moving the elements
+        back to the start of the storage.
+        """
+        self._linearize()
+        super().remove_indices(sorted_indices)
+
+
+class DynamicArrayView:
+    def __init__(self, source: DynamicArray, start_index: int,
+                 size: int) -> None:
+        """
+        Init a view of size elements of the source array starting at
+        start_index. The view shares the source's storage until it is
+        written to, at which point it copies the block into a
+        DynamicArray of its own and leaves the source unchanged.
+        Structural changes to the source (resizing, inserting, removing)
+        invalidate its views.
+        """
+        self._source = source
+        self._start = start_index
+        self._size = size
+        self._copy = None
 
     def __str__(self) -> str:
         """
-        Return content of dynamic array in human-readable form
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Return content of the view in human-readable form
         """
-        out = "DYN_ARR Size/Cap: "
-        out += str(self._size) + "/" + str(self._capacity) + ' ['
-        out += ', '.join([str(self._data[_]) for _ in range(self._size)])
+        if self._copy is not None:
+            return str(self._copy)
+
+        out = "DYN_ARR_VIEW Size: " + str(self._size) + ' ['
+        out += ', '.join([str(value) for value in self._values()])
         return out + ']'
 
     def __iter__(self):
         """
-        Create iterator for loop
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Creates an iterator over the elements of the view.
         """
-        self._index = 0
-        return self
+        if self._copy is not None:
+            return iter(self._copy)
+        return iter(self._values())
 
-    def __next__(self):
+    def __reversed__(self):
         """
-        Obtain next value and advance iterator
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Creates an iterator over the elements of the view from last to first.
         """
-        try:
-            value = self[self._index]
-        except DynamicArrayException:
-            raise StopIteration
+        if self._copy is not None:
+            return reversed(self._copy)
+        return (self.get_at_index(index)
+                for index in range(self._size - 1, -1, -1))
 
-        self._index += 1
-        return value
+    def _values(self):
+        """
+        Returns an iterable over the viewed block of the source array, or
+        over the copy once the view is materialized.
+        """
+        if self._copy is not None:
+            return self._copy._values()
+        return self._source._values(self._start, self._size)
 
     def get_at_index(self, index: int) -> object:
         """
-        Return value from given index position
-        Invalid index raises DynamicArrayException
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Takes an index as a parameter and returns the value found at
+        that position of the view.
         """
+        if self._copy is not None:
+            return self._copy.get_at_index(index)
+
         if index < 0 or index >= self._size:
             raise DynamicArrayException
-        return self._data[index]
+        source = self._source
+        return source._data[source._slot(self._start + index)]
 
     def set_at_index(self, index: int, value: object) -> None:
         """
-        Store value at given index in the array
-        Invalid index raises DynamicArrayException
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Takes an index and a value as parameters and stores the value at
+        that position, materializing the view first.
         """
-        if index < 0 or index >= self._size:
-            raise DynamicArrayException
-        self._data[index] = value
+        self.materialize().set_at_index(index, value)
 
     def __getitem__(self, index) -> object:
         """
-        Same functionality as get_at_index() method above,
-        but called using array[index] syntax
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Same as get_at_index().
         """
         return self.get_at_index(index)
 
     def __setitem__(self, index, value) -> None:
         """
-        Same functionality as set_at_index() method above,
-        but called using array[index] syntax
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Same as set_at_index(), materializing the view first.
         """
         self.set_at_index(index, value)
 
     def is_empty(self) -> bool:
         """
-        Return True is array is empty / False otherwise
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Returns True if the view holds no elements, False otherwise.
         """
-        return self._size == 0
+        return self.length() == 0
 
     def length(self) -> int:
         """
-        Return number of elements stored in array
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Returns the number of elements in the view.
         """
+        if self._copy is not None:
+            return self._copy.length()
         return self._size
 
     def get_capacity(self) -> int:
         """
-        Return the capacity of the array
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Returns the capacity of the materialized copy, or the size of the
+        view while it still shares the source's storage.
         """
-        return self._capacity
+        if self._copy is not None:
+            return self._copy.get_capacity()
+        return self._size
 
-    def print_da_variables(self) -> None:
+    def get_typecode(self) -> str:
         """
-        Print information contained in the dynamic array.
-        Used for testing purposes.
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Returns the typecode of the source array's storage.
         """
-        print(f"Length: {self._size}, Capacity: {self._capacity}, {self._data}")
-
-    # -----------------------------------------------------------------------
+        if self._copy is not None:
+            return self._copy.get_typecode()
+        return self._source.get_typecode()
 
-    def resize(self, new_capacity: int) -> None:
+    def as_memoryview(self) -> memoryview:
         """
-        Takes an integer as a parameter and resizes the array to the new
-        capacity if it is not smaller than the current size.
+        Returns a memoryview over the viewed block of a typed array.
         """
-        if new_capacity <= 0:
-            return None
-
-        if new_capacity < self._size:
-            return None
-
-        old_arr = self._data
-        self._data = StaticArray(new_capacity)
-        self._capacity = new_capacity
-
-        # SETS elements to fresh larger array
-        if new_capacity > old_arr.length():
-            for index in range(old_arr.length()):
-                self._data.set(index, old_arr.get(index))
-        else:
-            # SETS elements to fresh smaller array
-            for index in range(new_capacity):
-                self._data.set(index, old_arr.get(index))
+        if self._copy is not None:
+            return self._copy.as_memoryview()
+        return self._source.as_memoryview()[self._start:
+                                            self._start + self._size]
 
+    def is_materialized(self) -> bool:
+        """
+        Returns True if the view has copied its elements out of the
+        source array, False if it still shares the source's storage.
+        """
+        return self._copy is not None
 
+    def materialize(self) -> DynamicArray:
+        """
+        Copies the viewed block into a DynamicArray owned by the view
+        (once) and returns it. Later operations use the copy.
+        """
+        if self._copy is None:
+            if self._size == 0:
+                self._copy = DynamicArray(typecode=self.get_typecode())
+            else:
+                self._copy = self._source.slice(self._start, self._size)
+            self._source = None
+        return self._copy
 
     def append(self, value: object) -> None:
         """
-        Takes a value as a parameter and adds it to the end of the
-        elements in the list.
+        Same as DynamicArray.append(), after materializing the view.
         """
-        # DOUBLES array capacity if reached
-        if self._size >= self._capacity:
-            self.resize(self._capacity * 2)
+        self.materialize().append(value)
 
-        # APPENDS value
-        self._data[self._size] = value
-        self._size += 1
+    def extend(self, values) -> None:
+        """
+        Same as DynamicArray.extend(), after materializing the view.
+        """
+        self.materialize().extend(values)
 
     def insert_at_index(self, index: int, value: object) -> None:
         """
-        Takes an index and a value as parameters and inserts the value
-        at the index specified.
+        Same as DynamicArray.insert_at_index(), after materializing the view.
         """
-        # DOUBLES capacity if reached
-        if self._size >= self._capacity:
-            self.resize(self._capacity * 2)
-
-        # RAISES exception if index is invalid
-        if index > self._size or index < 0:
-            raise DynamicArrayException
-
-        # MOVES elements to allow for new value
-        count = self._size - 1
-        for val in range(index, self.length()):
-            self._data.set(count + 1, self._data.get(count))
-            count -= 1
-
-        # INSERTS value into place
-        self._data.set(index, value)
-        self._size += 1
+        self.materialize().insert_at_index(index, value)
 
     def remove_at_index(self, index: int) -> None:
         """
-        Takes an index as a parameter and removes the element of the
-        array found at the index specified.
+        Same as DynamicArray.remove_at_index(), after materializing the view.
         """
-        # RAISES exception if index is invalid
-        if index > self._size - 1 or index < 0:
-            raise DynamicArrayException
+        self.materialize().remove_at_index(index)
 
-        # RESIZES array if under 25% capacity
-        if self._size < self._capacity / 4:
-            if self._capacity <= 10:
-                pass
-            if self._capacity > 10:
-                if self._size >= 5:
-                    self.resize(self._size * 2)
-                else:
-                    self.resize(10)
+    def remove_where(self, predicate) -> int:
+        """
+        Same as DynamicArray.remove_where(), after materializing the view.
+        """
+        return self.materialize().remove_where(predicate)
 
-        # MOVES elements to occupy the empty space
-        for val in range(index, self._size - 1):
-            self._data[val] = self._data[val + 1]
-            self._data[val + 1] = None
+    def remove_indices(self, sorted_indices) -> None:
+        """
+        Same as DynamicArray.remove_indices(), after materializing the view.
+        """
+        self.materialize().remove_indices(sorted_indices)
 
-        self._size -= 1
+    def sort(self, key=None, reverse: bool = False) -> None:
+        """
+        Same as DynamicArray.sort(), after materializing the view.
+        """
+        self.materialize().sort(key, reverse)
 
-    def slice(self, start_index: int, size: int) -> "DynamicArray":
+    def argsort(self, key=None, reverse: bool = False) -> DynamicArray:
         """
-        Takes a starting index and a size as parameters and returns
-        a new array of the size specified, made from the elements
-        of the original array starting from the index specified.
+        Same as DynamicArray.argsort(), over the viewed elements.
         """
-        # RAISES exception if size is invalid
+        if self._copy is not None:
+            return self._copy.argsort(key, reverse)
+        return DynamicArray(self._values()).argsort(key, reverse)
+
+    def slice(self, start_index: int, size: int,
+              view: bool = False) -> "DynamicArray":
+        """
+        Takes a starting index and a size as parameters and returns a copy
+        of that part of the view, or a view of it with view=True.
+        """
+        if self._copy is not None:
+            return self._copy.slice(start_index, size, view)
+
+        # RAISES exception if size or index is invalid
         if size < 0 or start_index + size > self._size:
             raise DynamicArrayException
-
-        # RAISES exception if index is invalid
         if start_index < 0 or start_index >= self._size:
             raise DynamicArrayException
 
-        new_arr = DynamicArray()
-
-        # APPENDS elements from old array to new array
-        count = 0
-        for index in range(size):
-            new_arr.append(self._data[start_index + count])
-            count += 1
-        return new_arr
+        return self._source.slice(self._start + start_index, size, view)
 
-    def map(self, map_func) -> "DynamicArray":
+    def map(self, map_func, typecode: str = None) -> DynamicArray:
         """
-        Takes a map function as a parameter and returns a dynamic array
-        with elements being derived from the map function being applied
-        to the elements of the original array.
+        Takes a map function as a parameter and returns a new dynamic
+        array of the mapped elements of the view.
         """
-        # APPENDS new elements to new array
-        new_arr = DynamicArray()
-        for index in range(self._size):
-            new_arr.append(map_func(self._data[index]))
-        return new_arr
+        if self._copy is not None:
+            return self._copy.map(map_func, typecode)
 
-    def filter(self, filter_func) -> "DynamicArray":
+        if typecode is None:
+            typecode = self.get_typecode()
+        return DynamicArray.from_sized(map(map_func, self._values()),
+                                       self._size, typecode)
+
+    def filter(self, filter_func) -> DynamicArray:
         """
-        Takes a filter function as a parameter and returns a new
-        dynamic array with the elements filtered as specified
-        from the old array.
+        Takes a filter function as a parameter and returns a new dynamic
+        array of the elements of the view it returns True for.
         """
-        # APPENDS filtered elements to new array
-        new_arr = DynamicArray()
-        for index in range(self._size):
-            if filter_func(self._data[index]) is True:
-                new_arr.append(self._data[index])
-        return new_arr
+        if self._copy is not None:
+            return self._copy.filter(filter_func)
+
+        return DynamicArray([value for value in self._values()
+                             if filter_func(value) is True],
+                            self.get_typecode())
 
     def reduce(self, reduce_func, initializer=None) -> object:
         """
-        Takes a reduce function and an optional initializer as
-        parameters and returns the value derived from the reduce
-        function
+        Takes a reduce function and an optional initializer as parameters
+        and returns the value derived from reducing the view.
         """
-        start_index = 0
+        if self._copy is not None:
+            return self._copy.reduce(reduce_func, initializer)
 
-        # IF array is empty
         if self._size == 0:
             return initializer
+        if initializer is None:
+            return _reduce(reduce_func, self._values())
+        return _reduce(reduce_func, self._values(), initializer)
 
-        # SETS initializer to first element
+    def lazy(self) -> "DynamicArrayPipeline":
+        """
+        Returns a pipeline over the elements of the view.
+        """
+        if self._copy is not None:
+            return self._copy.lazy()
+        return DynamicArrayPipeline(self)
+
+
+class DynamicArrayPipeline:
+    def __init__(self, source, stages: tuple = ()) -> None:
+        """
+        Init a lazy pipeline over a DynamicArray or DynamicArrayView.
+        map() and filter() only record stages; nothing is computed until
+        the pipeline is consumed by reduce(), take(), first(), collect()
+        or iteration, which pull each element through every stage in a
+        single pass without building intermediate arrays. A view that
+        is written to before then is read through its copy.
+        """
+        self._source = source
+        self._stages = stages
+
+    def __iter__(self):
+        """
+        Creates an iterator yielding the results of the pipeline.
+        """
+        values = iter(self._source._values())
+        for kind, func in self._stages:
+            if kind == 'map':
+                values = map(func, values)
+            else:
+                values = _kept(func, values)
+        return values
+
+    def map(self, map_func) -> "DynamicArrayPipeline":
+        """
+        Takes a map function as a parameter and returns a new pipeline
+        with a map stage added.
+        """
+        return DynamicArrayPipeline(self._source,
+                                    self._stages + (('map', map_func),))
+
+    def filter(self, filter_func) -> "DynamicArrayPipeline":
+        """
+        Takes a filter function as a parameter and returns a new pipeline
+        that only keeps values the function returns True for.
+        """
+        return DynamicArrayPipeline(self._source,
+                                    self._stages + (('filter', filter_func),))
+
+    def reduce(self, reduce_func, initializer=None) -> object:
+        """
+        Takes a reduce function and an optional initializer as parameters
+        and returns the value derived from reducing the pipeline's
+        results, with the same rules as DynamicArray.reduce().
+        """
+        values = iter(self)
         if initializer is None:
-            initializer = self._data[0]
-            start_index = 1
+            initializer = next(values, None)
+        return _reduce(reduce_func, values, initializer)
 
-        # LOOPS reduce function
-        for index in range(start_index, self._size):
-            result = reduce_func(initializer, self._data[index])
-            initializer = result
+    def take(self, n: int, typecode: str = None) -> DynamicArray:
+        """
+        Takes a count as a parameter and returns a dynamic array of the
+        first n results, stopping the scan as soon as they are found.
+        """
+        if n < 0:
+            raise DynamicArrayException
+        return DynamicArray(islice(self, n), typecode)
 
-        return initializer
+    def first(self) -> object:
+        """
+        Returns the first result of the pipeline, scanning no further.
+        Raises DynamicArrayException if the pipeline has no results.
+        """
+        for value in self:
+            return value
+        raise DynamicArrayException
+
+    def collect(self, typecode: str = None) -> DynamicArray:
+        """
+        Returns a dynamic array holding every result of the pipeline.
+        """
+        return DynamicArray(iter(self), typecode)
+
+
+def pack_file_header(typecode: str, size: int) -> bytes:
+    """
+    Takes a typecode ('O' for objects) and a number of elements as
+    parameters and returns the FILE_HEADER for them on this machine.
+    """
+    itemsize = array(typecode).itemsize if typecode != 'O' else 0
+    return FILE_HEADER.pack(FILE_MAGIC, typecode.encode(), BYTE_ORDER,
+                            itemsize, size)
+
+
+def read_file_header(file) -> tuple:
+    """
+    Takes a binary file positioned at a FILE_HEADER as a parameter and
+    returns its (typecode, byte order, size), leaving the file positioned
+    at the elements. Anything else, including elements whose size differs
+    on this machine (such as 'l' saved where it is 8 bytes and read where
+    it is 4), raises DynamicArrayException.
+    """
+    raw = file.read(FILE_HEADER.size)
+    if len(raw) < FILE_HEADER.size:
+        raise DynamicArrayException
 
+    magic, typecode, byte_order, itemsize, size = FILE_HEADER.unpack(raw)
+    typecode = typecode.decode()
+    if magic != FILE_MAGIC or typecode not in TYPECODES + 'O':
+        raise DynamicArrayException
+    if itemsize != (array(typecode).itemsize if typecode != 'O' else 0):
+        raise DynamicArrayException
+    return typecode, byte_order, size
 
-def chunk(arr: DynamicArray) -> "DynamicArray":
+
+def _rebuild(cls, typecode: str, buffer, policy: ResizePolicy) -> DynamicArray:
+    """
+    Unpickles a typed array of class cls from its raw element buffer.
+    """
+    values = array(typecode)
+    values.frombytes(memoryview(buffer).cast('B'))
+    new_arr = cls(typecode=typecode, policy=policy)
+    new_arr._fill(values)
+    return new_arr
+
+
+def _map_block(map_func, typecode: str, values) -> object:
+    """
+    Worker task for DynamicArray.parallel_map(): maps one block.
+    """
+    if typecode is not None:
+        return array(typecode, map(map_func, values))
+    return [map_func(value) for value in values]
+
+
+def _filter_block(filter_func, values) -> list:
+    """
+    Worker task for DynamicArray.parallel_filter(): filters one block.
+    """
+    return [value for value in values if filter_func(value) is True]
+
+
+def _reduce_block(reduce_func, values) -> object:
+    """
+    Worker task for DynamicArray.parallel_reduce(): reduces one block.
+    """
+    return _reduce(reduce_func, values)
+
+
+def _kept(filter_func, values):
+    """
+    Takes a filter function and an iterator as parameters and yields the
+    values the function returns True for, matching DynamicArray.filter().
+    """
+    for value in values:
+        if filter_func(value) is True:
+            yield value
+
+
+def _merge_runs(keys: list, source: array, dest: array, start: int,
+                middle: int, end: int) -> None:
+    """
+    Merges the sorted index runs source[start:middle] and
+    source[middle:end] into dest[start:end] by their keys, taking from
+    the left run on ties so the merge is stable.
+    """
+    left, right = start, middle
+    for out in range(start, end):
+        if right >= end or (left < middle
+                            and not keys[source[right]] < keys[source[left]]):
+            dest[out] = source[left]
+            left += 1
+        else:
+            dest[out] = source[right]
+            right += 1
+
+
+def _run_bounds(keys: list) -> array:
+    """
+    Takes a list of keys as a parameter and returns the start index of
+    each ascending run, the same runs chunk() returns, followed by the
+    length of the list.
+    """
+    bounds = array('q', [0])
+    for index in range(1, len(keys)):
+        if keys[index] < keys[index - 1]:
+            bounds.append(index)
+    if keys:
+        bounds.append(len(keys))
+    return bounds
+
+
+def chunk(arr: DynamicArray, view: bool = False) -> "DynamicArray":
     """
     Takes a dynamic array as a parameter and returns a new dynamic array
     holding arrays of the contents of the original array in ascending order.
+    With view=True the chunks are views sharing the original array's
+    storage instead of copies, valid until the array is changed.
     """
     master_arr = DynamicArray()
     count = 0
@@ -307,13 +1631,13 @@ def chunk(arr: DynamicArray) -> "DynamicArray":
 
         # IF end of array is reached
         if index == arr.length() - 1:
-            new = arr.slice(start, count)
+            new = arr.slice(start, count, view)
             master_arr.append(new)
             return master_arr
 
         # CREATES new array if next element is not in ascending order
         if arr[index + 1] < arr[index]:
-            new = arr.slice(start, count)
+            new = arr.slice(start, count, view)
             master_arr.append(new)
             start = index + 1
             count = 0
@@ -324,86 +1648,76 @@ def find_mode(arr: DynamicArray) -> tuple[DynamicArray, int]:
     """
     Takes a dynamic array as a parameter and returns a tuple containing
     a dynamic array of the mode elements with the most instances in the
-    array as well as the total count of instances.
+    array as well as the total count of instances. The input does not
+    need to be sorted; modes are listed in order of first appearance.
     """
+    counts = {}
+    frequency = 0
 
-    new_index = 0
-    count_1 = 0
-    count_2 = 0
-    new_arr = DynamicArray()
+    # COUNTS every element in a single pass
+    for value in arr:
+        count = counts.get(value, 0) + 1
+        counts[value] = count
+        if count > frequency:
+            frequency = count
 
-    # IF array has only one value
-    if arr.length() == 1:
-        new_arr.append(arr[0])
-        return (new_arr, 1)
-
-    for index in range(arr.length()):
+    mode = DynamicArray()
+    for value, count in counts.items():
+        if count == frequency:
+            mode.append(value)
+    return (mode, frequency)
 
-        # FIRST VALUE
-        if index == 0:
-            count_1 += 1
-            new_arr.append(arr[index])
-
-        # IF element is a repeat instance
-        elif arr[index] == new_arr[new_index]:
-
-            # IF only one element is being counted
-            if count_2 == 0:
-                count_1 += 1
-            # IF a second element is being counted
-            elif count_2 != 0:
-                count_2 += 1
-            # IF end of array is reached
-            if index == arr.length() - 1 and count_2 != 0:
-                if count_2 < count_1:
-                    new_arr.remove_at_index(new_index)
-
-        # IF elements is not a repeat instance
-        elif arr[index] != new_arr[new_index]:
-
-            # IF end of array is reached
-            if index == arr.length() - 1:
-                # IF highest count is 1
-                if count_1 == 1:
-                    new_arr.append(arr[index])
-                # IF only one element is being counted
-                elif count_2 == 0:
-                    return (new_arr, count_1)
-                # IF second element has more instances than the first
-                if count_2 < count_1 and count_2 != 0:
-                    new_arr.remove_at_index(new_index)
-
-            # IF a second element has not been counted
-            elif count_2 == 0:
-                new_arr.append(arr[index])
-                new_index += 1
-                count_2 = 1
-
-            # CHECKS if element can be discarded
-            elif count_1 > count_2:
-                new_arr.remove_at_index(new_index)
-                new_arr.append(arr[index])
-                count_2 = 1
 
-            else:
-                new_arr.append(arr[index])
-                new_index += 1
-                count_2 = 1
-
-        # CHECKS if entire array should be replaced
-        if count_2 > count_1:
-            new_arr = DynamicArray()
-            new_arr.append(arr[index])
-            count_1 = count_2
-            count_2 = 0
-            new_index = 0
-
-    # FINALIZES new array
-    old_arr = new_arr
-    new_arr = DynamicArray()
-    for index in range(old_arr.length()):
-        new_arr.append(old_arr[index])
-    return (new_arr, count_1)
+def top_k_frequent(iterable, k: int,
+                   capacity: int = None) -> DynamicArray:
+    """
+    Takes an iterable, a number of values k and an optional summary
+    capacity (at least k, default k) as parameters and returns a dynamic
+    array of up to k (value, count) tuples for the most frequent values,
+    most frequent first. The values are counted with a Space-Saving
+    summary of capacity counters, so memory stays fixed however long the
+    stream is. Counts may overestimate by at most n / capacity for a
+    stream of n values, and any value occurring more than n / capacity
+    times is guaranteed to be reported when k = capacity.
+    """
+    if capacity is None:
+        capacity = k
+    if k <= 0 or capacity < k:
+        raise DynamicArrayException
+
+    counts = {}
+    heap = []
+    order = 0
+    for value in iterable:
+        if value in counts:
+            counts[value] += 1
+            continue
+
+        if len(counts) < capacity:
+            counts[value] = 1
+            heappush(heap, (1, order, value))
+            order += 1
+            continue
+
+        # FINDS the smallest counter, refreshing entries whose value has
+        # been counted since they were pushed
+        while True:
+            count, _, smallest = heap[0]
+            if counts[smallest] == count:
+                break
+            heapreplace(heap, (counts[smallest], order, smallest))
+            order += 1
+
+        # REPLACES the smallest counter with the new value
+        del counts[smallest]
+        counts[value] = count + 1
+        heapreplace(heap, (count + 1, order, value))
+        order += 1
+
+    top = DynamicArray()
+    for value, count in nlargest(k, counts.items(), key=lambda x: x[1]):
+        top.append((value, count))
+    return top
 
 
 # ------------------- BASIC TESTING -----------------------------------------
@@ -673,3 +1987,202 @@ if __name__ == "__main__":
         da.append(case[x])
         mode, frequency = find_mode(da)
         print(f"{da}\nMode: {mode}, Frequency: {frequency}")
+
+    print("\n# typed storage example 1")
+    da = DynamicArray([1.5, 2.5, 3.5, 4.5, 5.5], typecode='d')
+    da.print_da_variables()
+    da.insert_at_index(0, 0.5)
+    da.remove_at_index(3)
+    print(da, da.get_typecode())
+    print(da.slice(1, 3))
+    print(da.map(lambda x: x * 2))
+    print(da.map(round, typecode='q'))
+    print(da.filter(lambda x: x > 2))
+    print(da.reduce(lambda x, y: x + y))
+
+    print("\n# typed storage example 2")
+    da = DynamicArray(range(10), typecode='i')
+    view = da.as_memoryview()
+    print(view.format, view.itemsize, view.nbytes, view.tolist())
+    print(chunk(DynamicArray([3, 4, 1, 2, 5], typecode='b')))
+    print(chunk(DynamicArray([3, 4, 1, 2, 5], typecode='b'), view=True))
+
+    print("\n# extend example 1")
+    da = DynamicArray([1, 2, 3])
+    da.extend(range(4, 11))
+    print(da)
+    da.extend(DynamicArray([11, 12]))
+    da.extend(value * 10 for value in range(2))
+    print(da)
+
+    print("\n# from_sized example 1")
+    da = DynamicArray.from_sized((value ** 2 for value in range(9)), 9)
+    print(da)
+    da = DynamicArray.from_sized((value / 2 for value in range(5)), 5, 'd')
+    print(da)
+
+    print("\n# slice view example 1")
+    da = DynamicArray([1, 2, 3, 4, 5, 6, 7, 8, 9])
+    da_view = da.slice(1, 4, view=True)
+    print(da_view, da_view.is_materialized())
+    print(da_view.map(lambda x: x * 10), da_view.reduce(lambda x, y: x + y))
+    da[2] = 30
+    print(da_view, da_view.slice(1, 2, view=True))
+    da_view.remove_at_index(0)
+    print(da, da_view, da_view.is_materialized(), sep="\n")
+
+    print("\n# lazy example 1")
+    da = DynamicArray(range(1, 11))
+    pipeline = da.lazy().map(lambda x: x ** 2).filter(lambda x: x % 2 == 0)
+    print(pipeline.collect())
+    print(pipeline.reduce(lambda x, y: x + y))
+    print(pipeline.reduce(lambda x, y: x + y, 1000))
+    print(pipeline.take(2), pipeline.first())
+    print(da.slice(5, 5, view=True).lazy().map(lambda x: -x).collect('i'))
+    print(da.lazy().filter(lambda x: x > 100).reduce(lambda x, y: x + y))
+    view = da.slice(0, 3, view=True)
+    pipeline = view.lazy().map(lambda x: x * 10)
+    view[0] = 100
+    print(pipeline.collect(), da.slice(0, 3))
+
+    print("\n# parallel example 1")
+    from operator import add
+    da = DynamicArray(range(-50, 50))
+    print(da.parallel_map(abs, chunk_size=16).reduce(add))
+    print(da.parallel_filter(bool, chunk_size=16).length())
+    print(da.parallel_reduce(add, chunk_size=16), da.reduce(add))
+    da = DynamicArray(range(1000), typecode='q')
+    print(da.parallel_reduce(add, 5, chunk_size=64), da.reduce(add, 5))
+
+    print("\n# remove_where example 1")
+    da = DynamicArray(range(40))
+    print(da.remove_where(lambda x: x % 4 != 0), da)
+    da = DynamicArray(range(10), typecode='h')
+    print(da.remove_where(lambda x: x > 6), da)
+
+    print("\n# remove_indices example 1")
+    da = DynamicArray(range(10, 20))
+    da.remove_indices([0, 3, 4, 9])
+    print(da)
+    da = DynamicArray(range(10, 20), typecode='i')
+    da.remove_indices([1, 2, 8])
+    print(da)
+    try:
+        da.remove_indices([3, 2])
+    except Exception as e:
+        print("Exception raised:", type(e))
+
+    print("\n# resize policy example 1")
+    da = DynamicArray()
+    for i in range(1000):
+        da.append(i)
+    print(da.get_capacity(), da.get_resize_stats())
+    da = DynamicArray(policy=ResizePolicy(growth_factor=1.5, min_capacity=4))
+    for i in range(1000):
+        da.append(i)
+    print(da.get_capacity(), da.get_resize_stats())
+
+    print("\n# resize policy example 2")
+    for policy in [ResizePolicy(shrink_threshold=0.5, growth_factor=2),
+                   ResizePolicy(shrink_threshold=0.5, hysteresis=0.5)]:
+        da = DynamicArray(range(64), policy=policy)
+        for i in range(1000):
+            da.remove_at_index(da.length() - 1) if i % 2 else da.append(i)
+            if i % 100 == 0:
+                da.remove_where(lambda x: x < 40)
+        print(da.length(), da.get_capacity(), da.get_resize_stats())
+
+    print("\n# iterator example 1")
+    da = DynamicArray([1, 2, 3])
+    print([(x, y) for x in da for y in da])
+    print(list(reversed(da)), list(reversed(DynamicArray([1.5, 2.5], 'd'))))
+    print(list(reversed(da.slice(1, 2, view=True))))
+    da = DynamicArray([5, 6, 7, 8], 'i')
+    for value in da:
+        if value == 6:
+            da.remove_at_index(0)
+            da.append(9)
+        print(value, end=' ')
+    print()
+    for value in reversed(da):
+        da.remove_at_index(da.length() - 1)
+        print(value, end=' ')
+    print(da)
+
+    print("\n# circular example 1")
+    da = CircularDynamicArray([3, 4, 5])
+    da.appendleft(2)
+    da.appendleft(1)
+    print(da)
+    da.print_da_variables()
+    print(da.popleft(), da.pop(), da)
+    da.insert_at_index(1, 10)
+    da.insert_at_index(3, 20)
+    print(da)
+    da.remove_at_index(1)
+    print(da, da.slice(1, 2), da.reduce(lambda x, y: x + y))
+
+    print("\n# save/load example 1")
+    import os
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), 'saved.dat')
+    da = DynamicArray([1.5, 2.5, 3.5], 'd')
+    da.save(path)
+    print(DynamicArray.load(path), os.path.getsize(path))
+    DynamicArray([1, 'two', (3,)]).save(path)
+    print(DynamicArray.load(path))
+
+    # TRUNCATES a saved file, then gives another one a wrong element size
+    DynamicArray(range(4), 'l').save(path)
+    with open(path, 'r+b') as file:
+        file.truncate(os.path.getsize(path) - 1)
+    other = os.path.join(tempfile.mkdtemp(), 'other.dat')
+    DynamicArray(range(4), 'l').save(other)
+    with open(other, 'r+b') as file:
+        file.seek(6)
+        file.write(bytes([3]))
+    for broken in [path, other]:
+        try:
+            DynamicArray.load(broken)
+        except Exception as e:
+            print("Exception raised:", type(e))
+
+    print("\n# pickle example 1")
+    da = DynamicArray(range(5), 'q')
+    buffers = []
+    data = pickle.dumps(da, protocol=5, buffer_callback=buffers.append)
+    print(len(data), len(buffers), pickle.loads(data, buffers=buffers))
+    print(pickle.loads(pickle.dumps(da, protocol=2)))
+    print(pickle.loads(pickle.dumps(CircularDynamicArray([1, 2]))))
+
+    print("\n# sort example 1")
+    da = DynamicArray([5, 6, 7, 1, 2, 8, 3, 4])
+    print(da.argsort(), da.argsort(reverse=True))
+    da.sort()
+    print(da)
+    da = DynamicArray(['pear', 'fig', 'apple', 'kiwi', 'plum'])
+    da.sort(key=len)
+    print(da)
+    da.sort(key=len, reverse=True)
+    print(da)
+
+    print("\n# sort example 2")
+    names = DynamicArray(['ada', 'bob', 'cy', 'dee'])
+    ages = DynamicArray([36, 25, 41, 25], 'i')
+    order = ages.argsort()
+    print(order, [names[index] for index in order])
+    view = ages.slice(1, 3, view=True)
+    print(view.argsort())
+    view.append(1)
+    print(view.argsort(), view.argsort(reverse=True))
+
+    print("\n# find_mode example 2")
+    da = DynamicArray([3, 1, 2, 3, 1, 4, 1, 3])
+    mode, frequency = find_mode(da)
+    print(f"{da}\nMode: {mode}, Frequency: {frequency}")
+
+    print("\n# top_k_frequent example 1")
+    words = "the cat and the dog and the bird".split()
+    print(top_k_frequent(words, 2), top_k_frequent(words, 2, capacity=4))
+    events = (x % 7 if x % 3 else 0 for x in range(10000))
+    print(top_k_frequent(events, 2, capacity=16))
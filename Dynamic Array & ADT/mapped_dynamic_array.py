@@ -0,0 +1,240 @@
+# Name: Josue Bustamante
+# OSU Email: bustamjo@oregonstate.edu
+# Course: CS261 - Data Structures
+# Description: A typed DynamicArray whose storage is a memory-mapped file,
+#              so arrays of fixed-width records can be larger than memory.
+#              The file grows by extending and remapping it, and the current
+#              size is written to its header whenever the array is flushed.
+#              Files use the same layout as DynamicArray.save(), so saved
+#              typed arrays can be opened directly.
+
+
+import mmap
+import os
+
+from dynamic_array import *
+
+
+# same header as DynamicArray.save()
+HEADER = FILE_HEADER
+
+
+def read_header(path: str) -> tuple:
+    """
+    Takes a file path as a parameter and returns the (typecode, size)
+    stored in its header, or None if the file is missing or empty.
+    Files that are not typed arrays in this machine's byte order raise
+    DynamicArrayException.
+    """
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None
+
+    with open(path, 'rb') as file:
+        typecode, byte_order, size = read_file_header(file)
+    if typecode == 'O' or byte_order != BYTE_ORDER:
+        raise DynamicArrayException
+    return typecode, size
+
+
+class MappedDynamicArray(DynamicArray):
+    def __init__(self, path: str, typecode: str = None, start_array=None,
+                 policy: ResizePolicy = None):
+        """
+        Open the mapped array stored at path, or create it with the given
+        typecode if the file does not exist yet. Values in start_array
+        are appended after any elements already in the file.
+        """
+        header = read_header(path)
+        if header is not None:
+            if typecode is not None and typecode != header[0]:
+                raise DynamicArrayException
+            typecode = header[0]
+        elif typecode is None:
+            raise DynamicArrayException
+
+        self._path = path
+        self._file = open(path, 'r+b' if header is not None else 'w+b')
+        self._map = None
+        self._data = None
+        super().__init__(None, typecode, policy)
+
+        if header is not None:
+            self._size = header[1]
+        self._stats.peak_capacity = self._capacity
+
+        if start_array is not None:
+            self.extend(start_array)
+
+    @classmethod
+    def from_sized(cls, values, n: int, typecode: str = None,
+                   policy: ResizePolicy = None) -> DynamicArray:
+        """
+        Same as DynamicArray.from_sized(). A mapped array needs a path, so
+        the result is an in-memory DynamicArray.
+        """
+        return DynamicArray.from_sized(values, n, typecode, policy)
+
+    @classmethod
+    def load(cls, path: str, policy: ResizePolicy = None) -> DynamicArray:
+        """
+        Same as DynamicArray.load(), returning an in-memory DynamicArray
+        that does not write to the file. MappedDynamicArray(path) maps a
+        saved typed array in place instead.
+        """
+        return DynamicArray.load(path, policy)
+
+    def __enter__(self) -> "MappedDynamicArray":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def get_path(self) -> str:
+        """
+        Returns the path of the backing file.
+        """
+        return self._path
+
+    def _file_capacity(self) -> int:
+        """
+        Returns the number of records the backing file currently holds.
+        """
+        itemsize = array(self._typecode).itemsize
+        length = os.fstat(self._file.fileno()).st_size
+        return max(0, (length - HEADER.size) // itemsize)
+
+    def _new_storage(self, capacity: int) -> memoryview:
+        """
+        Maps the backing file when the array is opened, keeping the room
+        for any records the file already holds.
+        """
+        self._capacity = max(capacity, self._file_capacity())
+        return self._remap(self._capacity)
+
+    def _remap(self, capacity: int) -> memoryview:
+        """
+        Takes a capacity as a parameter, sets the file length to hold that
+        many records and maps it in place of the current mapping.
+        """
+        length = HEADER.size + capacity * array(self._typecode).itemsize
+        file_length = os.fstat(self._file.fileno()).st_size
+        if file_length < length:
+            self._file.truncate(length)
+
+        old_map, old_data = self._map, self._data
+        self._map = mmap.mmap(self._file.fileno(), length)
+        self._data = memoryview(self._map)[HEADER.size:].cast(self._typecode)
+
+        # CLOSES the old mapping unless views of it are still in use
+        released = True
+        if old_map is not None:
+            old_map.flush()
+            old_data.release()
+            try:
+                old_map.close()
+            except BufferError:
+                released = False
+
+        # SHRINKS the file only once nothing maps its old tail
+        if file_length > length and released:
+            self._file.truncate(length)
+        return self._data
+
+    def _block(self, start_index: int = 0, size: int = None) -> array:
+        """
+        Takes a start index and a size as parameters and returns an
+        in-memory copy of that block of records.
+        """
+        if size is None:
+            size = self._size - start_index
+        block = array(self._typecode)
+        block.frombytes(self._data[start_index:start_index + size].cast('B'))
+        return block
+
+    def resize(self, new_capacity: int) -> None:
+        """
+        Takes an integer as a parameter and changes the capacity by
+        resizing the backing file and remapping it. No records are copied.
+        """
+        if new_capacity <= 0 or new_capacity < self._size:
+            return None
+
+        self._remap(new_capacity)
+        self._capacity = new_capacity
+        self._stats.record(new_capacity, 0)
+
+    def __reduce_ex__(self, protocol: int):
+        """
+        Pickles the elements as an in-memory typed DynamicArray.
+        """
+        return self._reduce_as(DynamicArray, protocol)
+
+    def flush(self) -> None:
+        """
+        Writes the header and any modified records to the backing file.
+        """
+        self._map[:HEADER.size] = pack_file_header(self._typecode,
+                                                   self._size)
+        self._map.flush()
+
+    def close(self) -> None:
+        """
+        Flushes the array and releases the mapping and the backing file.
+        A mapping still exported by a memoryview is left for the garbage
+        collector to unmap once the memoryview is released.
+        """
+        if self._map is None:
+            return
+
+        self.flush()
+        self._data.release()
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+        self._file.close()
+        self._map = None
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    import tempfile
+
+    print("\n# mapped array example 1")
+    path = os.path.join(tempfile.mkdtemp(), 'records.dat')
+    with MappedDynamicArray(path, 'd', [0.5, 1.5, 2.5]) as da:
+        for value in range(10):
+            da.append(value * 10.0)
+        print(da)
+        print(da.get_resize_stats(), os.path.getsize(path))
+
+    print("\n# mapped array example 2")
+    with MappedDynamicArray(path) as da:
+        print(da.get_typecode(), da.length(), da[0], da[12])
+        da[0] = -1.0
+        da.remove_at_index(1)
+        print(da.slice(0, 4))
+        print(da.slice(2, 5, view=True).reduce(lambda x, y: x + y))
+        print(da.reduce(lambda x, y: x + y))
+    print(read_header(path))
+
+    print("\n# mapped array example 3")
+    saved = os.path.join(tempfile.mkdtemp(), 'saved.dat')
+    DynamicArray(range(6), 'i').save(saved)
+    with MappedDynamicArray(saved) as da:
+        da.append(6)
+        print(da, pickle.loads(pickle.dumps(da, protocol=5)))
+    print(DynamicArray.load(saved))
+    print(MappedDynamicArray.load(saved),
+          MappedDynamicArray.from_sized(range(3), 3, 'i'))
+
+    print("\n# mapped array example 4")
+    da = MappedDynamicArray(saved)
+    numbers = da.as_memoryview()
+    da.close()
+    print(numbers.tolist())
+    numbers.release()
+    print(DynamicArray.load(saved))
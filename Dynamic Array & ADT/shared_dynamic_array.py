@@ -0,0 +1,355 @@
+# Name: Josue Bustamante
+# OSU Email: bustamjo@oregonstate.edu
+# Course: CS261 - Data Structures
+# Description: A typed DynamicArray stored in shared memory. One process
+#              builds the array and any number of other processes attach to
+#              it by name and read the elements in place. A small control
+#              block publishes the size and a generation counter that the
+#              writer increments every time it moves the elements to a new,
+#              resized segment.
+
+
+import os
+import struct
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+from dynamic_array import *
+
+
+# control block: magic, typecode, padding, generation, size, capacity
+HEADER = struct.Struct('<4sc3xQQQ')
+MAGIC = b'DYNS'
+GENERATION, SIZE, CAPACITY = 1, 2, 3
+
+# before Python 3.13 every attached segment is registered with the resource
+# tracker, which unlinks it when the attaching interpreter exits
+REGISTERS_ATTACHED = os.name == 'posix' and sys.version_info < (3, 13)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Takes a segment name as a parameter and attaches to it without making
+    this process responsible for unlinking it.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+
+    segment = shared_memory.SharedMemory(name)
+    if REGISTERS_ATTACHED:
+        resource_tracker.unregister(segment._name, 'shared_memory')
+    return segment
+
+
+def _unlink(segment: shared_memory.SharedMemory) -> None:
+    """
+    Takes a segment created by this process as a parameter and unlinks it.
+    A reader sharing this process's resource tracker (the writer itself or
+    a multiprocessing child) may have unregistered it, so it is registered
+    again first for unlink() to unregister.
+    """
+    if REGISTERS_ATTACHED:
+        resource_tracker.register(segment._name, 'shared_memory')
+    segment.unlink()
+
+
+class SharedDynamicArray(DynamicArray):
+    def __init__(self, typecode: str, start_array=None, name: str = None,
+                 policy: ResizePolicy = None):
+        """
+        Create a shared array with the given typecode, under the given
+        name or a generated one (see get_name()). The creating process is
+        the only writer; other processes use SharedDynamicArray.attach().
+        """
+        if typecode not in TYPECODES:
+            raise DynamicArrayException
+
+        self._writer = True
+        self._control = shared_memory.SharedMemory(name, create=True,
+                                                   size=HEADER.size)
+        HEADER.pack_into(self._control.buf, 0, MAGIC, typecode.encode(),
+                         0, 0, 0)
+        self._meta = self._control.buf[:HEADER.size].cast('Q')
+        self._generation = -1
+        self._segment = None
+        self._retired = None
+        super().__init__(None, typecode, policy)
+        self._publish()
+
+        if start_array is not None:
+            self.extend(start_array)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedDynamicArray":
+        """
+        Takes the name of a shared array as a parameter and returns a
+        read-only array that reads the writer's elements without copying
+        them. Writing through it raises TypeError.
+        """
+        arr = cls.__new__(cls)
+        arr._writer = False
+        arr._control = _attach(name)
+        magic, typecode = HEADER.unpack_from(arr._control.buf)[:2]
+        if magic != MAGIC:
+            arr._control.close()
+            raise DynamicArrayException
+
+        arr._meta = arr._control.buf[:HEADER.size].cast('Q')
+        arr._typecode = typecode.decode()
+        arr._policy = DEFAULT_POLICY
+        arr._stats = ResizeStats()
+        arr._generation = None
+        arr._segment = None
+        arr._data = None
+        arr._capacity = 0
+        try:
+            arr.refresh()
+        except DynamicArrayException:
+            arr._meta.release()
+            arr._control.close()
+            raise
+        return arr
+
+    def __enter__(self) -> "SharedDynamicArray":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+        if self._writer:
+            self.unlink()
+
+    @property
+    def _size(self) -> int:
+        """
+        Number of elements, as published in the control block. A reader
+        that has not refreshed after a resize sees at most its capacity.
+        """
+        size = self._meta[SIZE]
+        if self._writer:
+            return size
+        return min(size, self._capacity)
+
+    @_size.setter
+    def _size(self, size: int) -> None:
+        if not self._writer:
+            raise DynamicArrayException
+        self._meta[SIZE] = size
+
+    def __reduce_ex__(self, protocol: int):
+        """
+        Pickles the array by name, so unpickling attaches a reader to the
+        same shared memory instead of copying the elements.
+        """
+        return SharedDynamicArray.attach, (self.get_name(),)
+
+    def get_name(self) -> str:
+        """
+        Returns the name readers attach to.
+        """
+        return self._control.name
+
+    def get_generation(self) -> int:
+        """
+        Returns the generation of the segment this array is reading.
+        """
+        return self._generation
+
+    def is_stale(self) -> bool:
+        """
+        Returns True if the writer has resized the array since this reader
+        attached or last refreshed, False otherwise.
+        """
+        return self._meta[GENERATION] != self._generation
+
+    def refresh(self) -> None:
+        """
+        Attaches a reader to the writer's current segment if the array
+        has been resized since it last did so. Raises DynamicArrayException
+        if the writer has unlinked the array.
+        """
+        while self.is_stale():
+            generation = self._meta[GENERATION]
+            try:
+                segment = _attach(self._segment_name(generation))
+            except FileNotFoundError:
+                # RETRIES only if the segment was retired by a newer resize
+                if self._meta[GENERATION] != generation:
+                    continue
+                raise DynamicArrayException
+
+            # RETRIES if the writer resized again while attaching
+            if self._meta[GENERATION] != generation:
+                segment.close()
+                continue
+
+            # TAKES the capacity from the segment itself, since the published
+            # one may already belong to a newer generation
+            old_segment, old_data = self._segment, self._data
+            itemsize = array(self._typecode).itemsize
+            capacity = segment.size // itemsize
+            self._data = segment.buf[:capacity * itemsize] \
+                .cast(self._typecode).toreadonly()
+            self._segment = segment
+            self._generation = generation
+            self._capacity = capacity
+            self._release(old_segment, old_data)
+
+    def _segment_name(self, generation: int) -> str:
+        """
+        Takes a generation as a parameter and returns the name of the
+        segment holding the elements for that generation.
+        """
+        return self._control.name + '_' + str(generation)
+
+    def _release(self, segment, data) -> None:
+        """
+        Takes a segment and the view of it as parameters and closes them,
+        leaving the segment mapped if other views of it are still in use.
+        """
+        if segment is None:
+            return
+        data.release()
+        try:
+            segment.close()
+        except BufferError:
+            pass
+
+    def _publish(self) -> None:
+        """
+        Publishes the writer's current generation and capacity.
+        """
+        self._meta[CAPACITY] = self._capacity
+        self._meta[GENERATION] = self._generation
+
+    def _new_storage(self, capacity: int) -> memoryview:
+        """
+        Takes a capacity as a parameter and returns a view of a new shared
+        segment of that capacity for the next generation.
+        """
+        itemsize = array(self._typecode).itemsize
+        self._generation += 1
+        segment = shared_memory.SharedMemory(
+            self._segment_name(self._generation), create=True,
+            size=capacity * itemsize)
+        self._retired = self._segment
+        self._segment = segment
+        return segment.buf[:capacity * itemsize].cast(self._typecode)
+
+    def _block(self, start_index: int = 0, size: int = None) -> array:
+        """
+        Takes a start index and a size as parameters and returns an
+        in-memory copy of that block of elements.
+        """
+        if size is None:
+            size = self._size - start_index
+        block = array(self._typecode)
+        block.frombytes(self._data[start_index:start_index + size].cast('B'))
+        return block
+
+    def resize(self, new_capacity: int) -> None:
+        """
+        Takes an integer as a parameter and moves the elements to a new
+        segment of that capacity, then publishes the new generation so
+        readers can detect the change and refresh.
+        """
+        if not self._writer:
+            raise DynamicArrayException
+
+        old_data = self._data
+        super().resize(new_capacity)
+        if self._retired is None:
+            return
+
+        self._publish()
+        retired, self._retired = self._retired, None
+        self._release(retired, old_data)
+        _unlink(retired)
+
+    def close(self) -> None:
+        """
+        Detaches this process from the array. The writer should call
+        unlink() once no reader needs the array any more.
+        """
+        if self._data is None:
+            return
+
+        self._release(self._segment, self._data)
+        self._meta.release()
+        self._control.close()
+        self._data = None
+
+    def unlink(self) -> None:
+        """
+        Frees the shared memory of the array (writer only).
+        """
+        if not self._writer:
+            raise DynamicArrayException
+        _unlink(self._segment)
+        _unlink(self._control)
+
+
+def _reader_total(name: str) -> tuple:
+    """
+    Attaches to a shared array from another process and returns its
+    generation and the sum of its elements.
+    """
+    with SharedDynamicArray.attach(name) as arr:
+        return arr.get_generation(), arr.reduce(lambda x, y: x + y)
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    import subprocess
+    from concurrent.futures import ProcessPoolExecutor
+
+    print("\n# shared array example 1")
+    with SharedDynamicArray('q', range(4)) as da:
+        reader = SharedDynamicArray.attach(da.get_name())
+        print(da, reader, reader.get_generation())
+        da.append(4)
+        print(reader, reader.is_stale())
+        reader.refresh()
+        print(reader, reader.is_stale(), reader.get_generation())
+        reader.close()
+
+        with ProcessPoolExecutor(2) as pool:
+            print(pool.submit(_reader_total, da.get_name()).result())
+            da.extend(range(5, 100))
+            print(pool.submit(_reader_total, da.get_name()).result())
+
+    print("\n# shared array example 2")
+    with SharedDynamicArray('i', range(3)) as da:
+        reader = pickle.loads(pickle.dumps(da))
+        da.append(3)
+        reader.refresh()
+        print(reader, reader.get_generation())
+        reader.close()
+
+    print("\n# shared array example 3")
+    da = SharedDynamicArray('q', range(4))
+    reader = SharedDynamicArray.attach(da.get_name())
+    da.append(4)
+    da.close()
+    da.unlink()
+    try:
+        reader.refresh()
+    except Exception as e:
+        print("Exception raised:", type(e))
+    reader.close()
+
+    # ATTACHES from a separate interpreter, whose exit must not unlink the
+    # writer's segments
+    print("\n# shared array example 4")
+    with SharedDynamicArray('q', range(10)) as da:
+        script = ('from shared_dynamic_array import *\n'
+                  'with SharedDynamicArray.attach(%r) as arr:\n'
+                  '    print(arr.reduce(lambda x, y: x + y))' % da.get_name())
+        subprocess.run([sys.executable, '-c', script], check=True,
+                       cwd=os.path.dirname(os.path.abspath(__file__)))
+        da.append(10)
+        reader = SharedDynamicArray.attach(da.get_name())
+        print(reader, reader.get_generation())
+        reader.close()
@@ -0,0 +1,223 @@
+# Name: Josue Bustamante
+# OSU Email: bustamjo@oregonstate.edu
+# Course: CS261 - Data Structures
+# Description: A DynamicArray that keeps its elements in ascending order.
+#              Searches use binary search, insert_sorted() shifts a single
+#              block, range() returns a view of the elements between two
+#              bounds and merge_sorted() merges another sorted array in
+#              linear time. Changes that would break the order raise
+#              DynamicArrayException.
+
+
+from bisect import bisect_left, bisect_right
+
+from dynamic_array import *
+
+
+class SortedDynamicArray(DynamicArray):
+    def __init__(self, start_array=None, typecode: str = None,
+                 policy: ResizePolicy = None):
+        """
+        Create a sorted array holding the values of start_array in
+        ascending order.
+        """
+        super().__init__(start_array, typecode, policy)
+
+    @classmethod
+    def from_sized(cls, values, n: int, typecode: str = None,
+                   policy: ResizePolicy = None) -> "SortedDynamicArray":
+        """
+        Same as DynamicArray.from_sized(), sorting the values once filled.
+        """
+        new_arr = super().from_sized(values, n, typecode, policy)
+        DynamicArray.sort(new_arr)
+        return new_arr
+
+    @classmethod
+    def load(cls, path: str,
+             policy: ResizePolicy = None) -> "SortedDynamicArray":
+        """
+        Same as DynamicArray.load(), sorting the elements once read, so a
+        file saved from an unsorted array loads in ascending order.
+        """
+        new_arr = super().load(path, policy)
+        DynamicArray.sort(new_arr)
+        return new_arr
+
+    def _search_data(self):
+        """
+        Returns the storage in a form bisect can index directly.
+        """
+        if self._typecode is not None:
+            return memoryview(self._data)
+        return self._data
+
+    def _in_order(self, index: int, value: object) -> bool:
+        """
+        Takes an index and a value as parameters and returns True if the
+        value fits between the elements before and at the index.
+        """
+        if index > 0 and value < self._data[index - 1]:
+            return False
+        if index < self._size and self._data[index] < value:
+            return False
+        return True
+
+    def index_of(self, value: object) -> int:
+        """
+        Takes a value as a parameter and returns the index of its first
+        occurrence, or -1 if the array does not contain it.
+        """
+        index = bisect_left(self._search_data(), value, 0, self._size)
+        if index < self._size and self._data[index] == value:
+            return index
+        return -1
+
+    def contains(self, value: object) -> bool:
+        """
+        Takes a value as a parameter and returns True if the array
+        contains it, False otherwise.
+        """
+        return self.index_of(value) != -1
+
+    def insert_sorted(self, value: object) -> int:
+        """
+        Takes a value as a parameter, inserts it after any equal elements
+        and returns the index it was inserted at.
+        """
+        index = bisect_right(self._search_data(), value, 0, self._size)
+        super().insert_at_index(index, value)
+        return index
+
+    def range(self, lo: object, hi: object) -> DynamicArrayView:
+        """
+        Takes a lower and an upper bound as parameters and returns a view
+        of the elements that are at least lo and less than hi.
+        """
+        data = self._search_data()
+        start = bisect_left(data, lo, 0, self._size)
+        end = max(start, bisect_left(data, hi, start, self._size))
+        return DynamicArrayView(self, start, end - start)
+
+    def merge_sorted(self, other) -> None:
+        """
+        Takes an array or other sequence in ascending order as a parameter
+        and merges its values into this array in linear time. Elements
+        equal to existing ones are placed after them.
+        """
+        if other is self or not isinstance(other, (DynamicArray, list)):
+            other = list(other)
+        count = len(other) if isinstance(other, list) else other.length()
+        for index in range(1, count):
+            if other[index] < other[index - 1]:
+                raise DynamicArrayException
+
+        self._reserve(self._size + count)
+
+        # MERGES from the back so no element is moved twice
+        left = self._size - 1
+        right = count - 1
+        for out in range(self._size + count - 1, -1, -1):
+            if right < 0:
+                break
+            if left >= 0 and other[right] < self._data[left]:
+                self._data[out] = self._data[left]
+                left -= 1
+            else:
+                self._data[out] = other[right]
+                right -= 1
+        self._size += count
+
+    def append(self, value: object) -> None:
+        """
+        Takes a value as a parameter and adds it to the end of the array.
+        Raises DynamicArrayException if the value is smaller than the
+        last element.
+        """
+        if not self._in_order(self._size, value):
+            raise DynamicArrayException
+        super().append(value)
+
+    def extend(self, values) -> None:
+        """
+        Takes an iterable as a parameter and merges its values into the
+        array.
+        """
+        values = DynamicArray(values)
+        values.sort()
+        self.merge_sorted(values)
+
+    def insert_at_index(self, index: int, value: object) -> None:
+        """
+        Takes an index and a value as parameters and inserts the value at
+        the index. Raises DynamicArrayException if the value does not
+        belong there.
+        """
+        if 0 <= index <= self._size and not self._in_order(index, value):
+            raise DynamicArrayException
+        super().insert_at_index(index, value)
+
+    def set_at_index(self, index: int, value: object) -> None:
+        """
+        Takes an index and a value as parameters and replaces the element
+        at the index. Raises DynamicArrayException if the value does not
+        belong there.
+        """
+        if 0 <= index < self._size:
+            if (index > 0 and value < self._data[index - 1]) or \
+                    (index < self._size - 1 and self._data[index + 1] < value):
+                raise DynamicArrayException
+        super().set_at_index(index, value)
+
+    def sort(self, key=None, reverse: bool = False) -> None:
+        """
+        The array is always sorted; any other order raises
+        DynamicArrayException.
+        """
+        if key is not None or reverse:
+            raise DynamicArrayException
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    import os
+    import tempfile
+
+    print("\n# sorted array example 1")
+    da = SortedDynamicArray([7, 3, 9, 1, 3])
+    print(da)
+    print(da.index_of(3), da.index_of(4), da.contains(9), da.contains(10))
+    print(da.insert_sorted(4), da.insert_sorted(3), da.insert_sorted(0))
+    print(da)
+    print(da.range(3, 8), da.range(20, 30))
+
+    print("\n# sorted array example 2")
+    da = SortedDynamicArray([1.5, 4.5, 9.5], 'd')
+    da.merge_sorted([0.5, 4.5, 10.5])
+    print(da)
+    da.extend([8.5, 2.5])
+    da.append(11.0)
+    print(da, da.get_resize_stats())
+    for value in [0.0, 20.0]:
+        try:
+            da.append(value)
+            da.set_at_index(0, value)
+        except Exception as e:
+            print("Exception raised:", type(e))
+
+    print("\n# sorted array example 3")
+    da = SortedDynamicArray(['pear', 'fig', 'apple'])
+    other = SortedDynamicArray(['kiwi', 'date'])
+    da.merge_sorted(other)
+    da.merge_sorted(da)
+    print(da, da.range('d', 'l').length())
+
+    print("\n# sorted array example 4")
+    path = os.path.join(tempfile.mkdtemp(), 'unsorted.dat')
+    DynamicArray([3, 1, 2], 'q').save(path)
+    da = SortedDynamicArray.load(path)
+    print(da, da.contains(1))
+    print(da.insert_sorted(2), da.range(2, 3))
@@ -261,9 +261,9 @@ def find_mode(da: DynamicArray) -> tuple[DynamicArray, int]:
     """
 
     map = HashMap()
-    tup = ()
+    frequency = 0
 
-    # CHECKS if array element is in hash map
+    # COUNTS array elements in hash map, tracking the highest count
     for index in range(da.length()):
         bucket = map.compute_bucket(da[index])
         result = bucket.contains(da[index])
@@ -271,39 +271,28 @@ def find_mode(da: DynamicArray) -> tuple[DynamicArray, int]:
         # IF found, increment count
         if result is not None:
             result.value += 1
+            count = result.value
 
         # IF not found, add to hash map
         else:
             map.put(da[index], 1)
+            count = 1
 
-    # COMPARES elements in array to elements in hash map
+        if count > frequency:
+            frequency = count
+
+    # COLLECTS modes in order of first appearance
+    mode = DynamicArray()
     for index in range(da.length()):
         bucket = map.compute_bucket(da[index])
         result = bucket.contains(da[index])
 
-        # IF tuple is not empty
-        if len(tup) != 0:
-
-            # IF new mode is found
-            if result.value > tup[1]:
-                tup = (DynamicArray(0), result.value)
-                tup[0].append(result.key)
-
-            # IF additional mode is found
-            elif result.value == tup[1]:
-                for val in range(tup[0].length()):
-
-                    # CHECKS if new mode is not in tuple
-                    if val == tup[0].length() - 1 and tup[0][val] != result.key:
-                        tup[0].append(result.key)
-                    elif tup[0][val] == result.key:
-                        break
-        else:
-            # IF tuple is empty
-            tup = (DynamicArray(), result.value)
-            tup[0].append(result.key)
+        # IF mode is found, clear its count so it is only added once
+        if result.value == frequency:
+            mode.append(result.key)
+            result.value = 0
 
-    return tup
+    return (mode, frequency)
 
 
 # ------------------- BASIC TESTING ---------------------------------------- #
@@ -8,7 +8,7 @@
 #              returning the top element.
 
 
-from SLNode import SLNode
+from slotted_node import NodePool, new_node
 
 
 class QueueException(Exception):
@@ -20,11 +20,12 @@ class QueueException(Exception):
 
 
 class Queue:
-    def __init__(self):
+    def __init__(self, pool: NodePool = None):
         """
-        Initialize new queue with head and tail nodes
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Initialize new queue with head and tail nodes, taking nodes from
+        the optional pool and returning dequeued nodes to it
         """
+        self._pool = pool
         self._head = None
         self._tail = None
 
@@ -72,11 +73,11 @@ class Queue:
 
         # CHECKS if queue is empty
         if self.is_empty() is True:
-            self._head = SLNode(value)
+            self._head = new_node(self._pool, value)
             self._tail = self._head
             return
 
-        self._tail.next = SLNode(value)
+        self._tail.next = new_node(self._pool, value)
         self._tail = self._tail.next
 
     def dequeue(self) -> object:
@@ -85,11 +86,14 @@ class Queue:
         """
 
         # CHECKS if queue is empty
-        if self.size() == 0:
+        if self.is_empty() is True:
             raise QueueException
 
-        value = self._head.value
-        self._head = self._head.next
+        node = self._head
+        value = node.value
+        self._head = node.next
+        if self._pool is not None:
+            self._pool.release(node)
         return value
 
     def front(self) -> object:
@@ -97,7 +101,7 @@ class Queue:
         Returns the value contained by the node at the front of the queue.
         """
         # CHECKS if queue is empty
-        if self.size() == 0:
+        if self.is_empty() is True:
             raise QueueException
 
         value = self._head.value
@@ -0,0 +1,406 @@
+# Name: Josue Bustamante
+# OSU Email: bustamjo@oregonstate.edu
+# Course: CS261 - Data Structures
+# Description: An indexable skip list with the methods of LinkedList. Each
+#              node links forward on one or more levels, and every link
+#              records its span: the number of values it skips over. Summing
+#              spans while descending the levels finds any position in
+#              expected O(log n), so insert_at_index, remove_at_index,
+#              get_at_index and the start of slice no longer walk the whole
+#              list. In ordered mode values are kept in ascending order and
+#              find, count and remove search by value in expected O(log n).
+
+
+import random
+from itertools import islice
+
+from sll import SLLException
+
+
+# most levels a node can link on, enough for about 2 ** MAX_LEVEL values
+MAX_LEVEL = 32
+
+
+class SkipNode:
+    """
+    Skip list node holding a value and, for each of its levels, the next
+    node and the number of values that link skips over
+    """
+    __slots__ = ('value', 'next', 'span')
+
+    def __init__(self, value: object, level: int) -> None:
+        self.value = value
+        self.next = [None] * level
+        self.span = [0] * level
+
+
+class SkipList:
+    def __init__(self, start_list=None, ordered: bool = False,
+                 seed: int = None) -> None:
+        """
+        Initialize new skip list. With ordered=True values are kept in
+        ascending order. The optional seed makes node levels repeatable.
+        """
+        self._head = SkipNode(None, MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+        self._ordered = ordered
+        self._random = random.Random(seed)
+
+        # populate list with initial values (if provided)
+        if start_list is not None:
+            for value in start_list:
+                if ordered:
+                    self.insert(value)
+                else:
+                    self.insert_back(value)
+
+    def __str__(self) -> str:
+        """
+        Return content of the list in human-readable form, matching
+        LinkedList
+        """
+        out = 'SLL ['
+        out += ' -> '.join(str(value) for value in self)
+        out += ']'
+        return out
+
+    def __iter__(self):
+        """
+        Yields the values of the list from front to back.
+        """
+        node = self._head.next[0]
+        while node:
+            yield node.value
+            node = node.next[0]
+
+    def length(self) -> int:
+        """
+        Return the length of the list
+        """
+        return self._size
+
+    def is_empty(self) -> bool:
+        """
+        Return True is list is empty, False otherwise
+        """
+        return self._size == 0
+
+    def is_ordered(self) -> bool:
+        """
+        Return True if the list keeps its values in ascending order
+        """
+        return self._ordered
+
+    # ------------------------------------------------------------------ #
+
+    def _random_level(self) -> int:
+        """
+        Returns the level of a new node: each level above the first is
+        reached with probability 1/2.
+        """
+        level = 1
+        bits = self._random.getrandbits(MAX_LEVEL - 1)
+        while bits & 1:
+            level += 1
+            bits >>= 1
+        return level
+
+    def _path_to_index(self, index: int) -> tuple:
+        """
+        Takes an index as a parameter and returns, for each level, the
+        last node before that index and its position (0 for the head,
+        i + 1 for the value at index i).
+        """
+        update = [self._head] * MAX_LEVEL
+        rank = [0] * MAX_LEVEL
+        node = self._head
+        traversed = 0
+        for level in range(self._level - 1, -1, -1):
+            while node.next[level] is not None \
+                    and traversed + node.span[level] <= index:
+                traversed += node.span[level]
+                node = node.next[level]
+            update[level] = node
+            rank[level] = traversed
+        return update, rank
+
+    def _path_to_value(self, value: object, after_equal: bool) -> tuple:
+        """
+        Takes a value as a parameter and returns the same path as
+        _path_to_index() for the position before the first value not
+        less than it, or not less than or equal to it with after_equal.
+        """
+        update = [self._head] * MAX_LEVEL
+        rank = [0] * MAX_LEVEL
+        node = self._head
+        traversed = 0
+        for level in range(self._level - 1, -1, -1):
+            while node.next[level] is not None and (
+                    node.next[level].value < value or after_equal
+                    and not value < node.next[level].value):
+                traversed += node.span[level]
+                node = node.next[level]
+            update[level] = node
+            rank[level] = traversed
+        return update, rank
+
+    def _link(self, update: list, rank: list, value: object) -> None:
+        """
+        Takes the path returned for a position as a parameter and inserts
+        a node holding value there, updating the spans of the links it
+        splits and of the links passing over it.
+        """
+        index = rank[0]
+        level = self._random_level()
+        if level > self._level:
+            for new_level in range(self._level, level):
+                update[new_level] = self._head
+                rank[new_level] = 0
+                self._head.span[new_level] = self._size
+            self._level = level
+
+        node = SkipNode(value, level)
+        for link in range(level):
+            before = update[link]
+            node.next[link] = before.next[link]
+            before.next[link] = node
+            node.span[link] = before.span[link] - (index - rank[link])
+            before.span[link] = index - rank[link] + 1
+
+        for link in range(level, self._level):
+            update[link].span[link] += 1
+        self._size += 1
+
+    def _unlink(self, update: list, target: SkipNode) -> None:
+        """
+        Takes the path to a node and the node as parameters and removes
+        it, merging the spans of the links around it.
+        """
+        for link in range(self._level):
+            before = update[link]
+            if before.next[link] is target:
+                before.span[link] += target.span[link] - 1
+                before.next[link] = target.next[link]
+            else:
+                before.span[link] -= 1
+
+        while self._level > 1 and self._head.next[self._level - 1] is None:
+            self._level -= 1
+        self._size -= 1
+
+    def _node_at(self, index: int) -> SkipNode:
+        """
+        Takes a valid index as a parameter and returns the node holding
+        the value at that index.
+        """
+        update, rank = self._path_to_index(index)
+        return update[0].next[0]
+
+    def get_at_index(self, index: int) -> object:
+        """
+        Takes an index as a parameter and returns the value at that index.
+        """
+        if index >= self._size or index < 0:
+            raise SLLException
+        return self._node_at(index).value
+
+    def insert(self, value: object) -> int:
+        """
+        Takes a value as a parameter, inserts it after any equal values in
+        an ordered list and returns its index.
+        """
+        if not self._ordered:
+            raise SLLException
+
+        update, rank = self._path_to_value(value, True)
+        self._link(update, rank, value)
+        return rank[0]
+
+    def insert_front(self, value: object) -> None:
+        """
+        Takes a value as a parameter and inserts it at the front of the
+        list.
+        """
+        self.insert_at_index(0, value)
+
+    def insert_back(self, value: object) -> None:
+        """
+        Takes a value as a parameter and inserts it at the back of the
+        list.
+        """
+        self.insert_at_index(self._size, value)
+
+    def insert_at_index(self, index: int, value: object) -> None:
+        """
+        Takes an index and value as parameters and inserts the value at
+        the index specified. In an ordered list the value must fit
+        between its neighbours.
+        """
+        # CHECKS if index is invalid
+        if index > self._size or index < 0:
+            raise SLLException
+
+        update, rank = self._path_to_index(index)
+
+        # CHECKS if value keeps an ordered list in order
+        if self._ordered:
+            before = update[0]
+            after = before.next[0]
+            if before is not self._head and value < before.value or \
+                    after is not None and after.value < value:
+                raise SLLException
+
+        self._link(update, rank, value)
+
+    def remove_at_index(self, index: int) -> None:
+        """
+        Takes an index as a parameter and removes the value at the index
+        specified.
+        """
+        # CHECKS if index is invalid
+        if index >= self._size or index < 0:
+            raise SLLException
+
+        update, rank = self._path_to_index(index)
+        self._unlink(update, update[0].next[0])
+
+    def remove(self, value: object) -> bool:
+        """
+        Takes a value as a parameter and removes its first instance,
+        returning True if the procedure was successful and False
+        otherwise.
+        """
+        # CHECKS if value is invalid
+        if value is None:
+            return False
+
+        # SEARCHES by value in an ordered list
+        if self._ordered:
+            update, rank = self._path_to_value(value, False)
+            target = update[0].next[0]
+            if target is None or target.value != value:
+                return False
+            self._unlink(update, target)
+            return True
+
+        index = self.index_of(value)
+        if index == -1:
+            return False
+        self.remove_at_index(index)
+        return True
+
+    def index_of(self, value: object) -> int:
+        """
+        Takes a value as a parameter and returns the index of its first
+        instance, or -1 if the list does not contain it.
+        """
+        if self._ordered:
+            update, rank = self._path_to_value(value, False)
+            target = update[0].next[0]
+            if target is None or target.value != value:
+                return -1
+            return rank[0]
+
+        for index, item in enumerate(self):
+            if item == value:
+                return index
+        return -1
+
+    def count(self, value: object) -> int:
+        """
+        Takes a value as a parameter and returns a count of how many
+        instances that value appears in the list.
+        """
+        # SUBTRACTS the positions around the run of equal values
+        if self._ordered:
+            first = self._path_to_value(value, False)[1][0]
+            last = self._path_to_value(value, True)[1][0]
+            return last - first
+
+        count = 0
+        for item in self:
+            if item == value:
+                count += 1
+        return count
+
+    def find(self, value: object) -> bool:
+        """
+        Takes a value as a parameter and returns True if that value is
+        found in the list, returning False otherwise.
+        """
+        # CHECKS if value is provided
+        if value is None:
+            return False
+        return self.index_of(value) != -1
+
+    def slice(self, start_index: int, size: int) -> "SkipList":
+        """
+        Takes an index and size as parameters and returns a new list of
+        the size specified holding the values starting from the index
+        provided.
+        """
+        # CHECKS if size is valid
+        if size < 0 or start_index + size > self._size:
+            raise SLLException
+
+        # CHECKS if start index is valid
+        if start_index < 0 or start_index >= self._size:
+            raise SLLException
+
+        def values():
+            node = self._node_at(start_index)
+            while node:
+                yield node.value
+                node = node.next[0]
+
+        new_list = SkipList(None, self._ordered,
+                            self._random.getrandbits(32))
+        for value in islice(values(), size):
+            new_list.insert_at_index(new_list._size, value)
+        return new_list
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    import timeit
+
+    from sll import LinkedList
+
+    print("\n# skip list example 1")
+    lst = SkipList(["A", "B", "C"], seed=1)
+    lst.insert_at_index(1, "D")
+    lst.insert_front("E")
+    print(lst, lst.length(), lst.get_at_index(2))
+    for index in [0, 2, -1]:
+        try:
+            lst.remove_at_index(index)
+            print(lst)
+        except Exception as e:
+            print(type(e))
+    print(lst.find("C"), lst.remove("X"), lst.remove("A"), lst)
+
+    print("\n# skip list example 2")
+    lst = SkipList([5, 1, 4, 1, 3, 9, 1], ordered=True, seed=2)
+    print(lst, lst.find(4), lst.find(6), lst.count(1), lst.index_of(3))
+    print(lst.insert(2), lst.remove(1), lst.remove(6), lst)
+    print(lst.slice(2, 3), lst.slice(2, 3).is_ordered())
+    try:
+        lst.insert_at_index(0, 100)
+    except Exception as e:
+        print(type(e))
+
+    print("\n# positional benchmark")
+    for cls in [LinkedList, SkipList]:
+        lst = cls(range(20000))
+
+        def churn() -> None:
+            for index in range(0, 20000, 200):
+                lst.insert_at_index(index, -1)
+                lst.remove_at_index(index)
+
+        seconds = min(timeit.repeat(churn, number=1, repeat=3))
+        print(cls.__name__, f"insert/remove: {seconds * 1000:.1f} ms")
@@ -9,10 +9,14 @@
 #              specified index as well as that containing a specific value.
 #              Finally, this code also holds methods to find a specific value and
 #              count the instances of a value in a list, as well as to splice the
-#              original list into a subset of that list.
+#              original list into a subset of that list. The list keeps a
+#              pointer to its last node and a count of its nodes, so
+#              length() and insert_back() take constant time.
 
 
-from SLNode import *
+from itertools import islice
+
+from slotted_node import *
 
 
 class SLLException(Exception):
@@ -24,12 +28,15 @@ class SLLException(Exception):
 
 
 class LinkedList:
-    def __init__(self, start_list=None) -> None:
+    def __init__(self, start_list=None, pool: NodePool = None) -> None:
         """
-        Initialize new linked list
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Initialize new linked list, taking nodes from the optional pool
+        and returning removed nodes to it
         """
-        self._head = SLNode(None)
+        self._pool = pool
+        self._head = SlottedNode(None)
+        self._tail = self._head
+        self._size = 0
 
         # populate SLL with initial values (if provided)
         # before using this feature, implement insert_back() method
@@ -55,14 +62,8 @@ class LinkedList:
     def length(self) -> int:
         """
         Return the length of the linked list
-        DO NOT CHANGE THIS METHOD IN ANY WAY
         """
-        length = 0
-        node = self._head.next
-        while node:
-            length += 1
-            node = node.next
-        return length
+        return self._size
 
     def is_empty(self) -> bool:
         """
@@ -79,14 +80,13 @@ class LinkedList:
         that value at the front of a linked list.
         """
 
-        # CHECKS if linked list is empty
-        if self.is_empty() is True:
-            self._head.next = SLNode(value)
-            return
-
         # INSERTS new node at head and shifts linked list
-        old_node = self._head.next
-        self._head.next = SLNode(value, old_node)
+        self._head.next = new_node(self._pool, value, self._head.next)
+
+        # CHECKS if linked list was empty
+        if self._tail is self._head:
+            self._tail = self._head.next
+        self._size += 1
 
     def insert_back(self, value: object) -> None:
         """
@@ -94,19 +94,20 @@ class LinkedList:
         that value at the back of a linked list.
         """
 
-        # CHECKS if linked list is empty
-        if self.is_empty() is True:
-            self._head.next = SLNode(value)
-            return
-
-        target = self._head.next
-
-        # ITERATES to end of linked list
-        for val in range(self.length()):
-            if target.next is None:
-                target.next = SLNode(value)
+        # LINKS new node after the tail
+        self._tail.next = new_node(self._pool, value)
+        self._tail = self._tail.next
+        self._size += 1
 
+    def _node_before(self, index: int) -> SlottedNode:
+        """
+        Takes an index as a parameter and returns the node before that
+        index (the head sentinel for index 0).
+        """
+        target = self._head
+        for val in range(index):
             target = target.next
+        return target
 
     def insert_at_index(self, index: int, value: object) -> None:
         """
@@ -114,27 +115,18 @@ class LinkedList:
         containing that value at the index specified.
         """
         # CHECKS if index is invalid
-        if index > self.length() or index < 0:
+        if index > self._size or index < 0:
             raise SLLException
 
-        # CHECKS if linked list is empty
-        if self.is_empty() is True:
-            self._head.next = SLNode(value)
+        # CHECKS if node will be inserted at back of linked list
+        if index == self._size:
+            self.insert_back(value)
             return
 
-        # CHECKS if node will be inserted at front of linked list
-        elif index == 0:
-            next_node = self._head.next
-            self._head.next = SLNode(value, next_node)
-
-        target = self._head.next
-
-        # ITERATES through list to target index
-        for val in range(index):
-            if val != index - 1:
-                target = target.next
-            else:
-                target.next = SLNode(value, target.next)
+        # ITERATES through list to node before target index
+        target = self._node_before(index)
+        target.next = new_node(self._pool, value, target.next)
+        self._size += 1
 
     def remove_at_index(self, index: int) -> None:
         """
@@ -143,28 +135,25 @@ class LinkedList:
         """
 
         # CHECKS if index is invalid
-        if index >= self.length() or index < 0:
+        if index >= self._size or index < 0:
             raise SLLException
 
-        # CHECKS if linked list is empty
-        if self.is_empty() is True:
-            raise SLLException
+        # ITERATES through list to node before index specified
+        target = self._node_before(index)
+        self._unlink_after(target)
 
-        target = self._head.next
+    def _unlink_after(self, target: SlottedNode) -> None:
+        """
+        Takes a node as a parameter and removes the node following it,
+        moving the tail back if that node was the last one.
+        """
         next_node = target.next
-
-        # CHECKS if front node is to be removed
-        if index == 0:
-            self._head.next = next_node
-            return
-
-        # ITERATES through list to reach index specified
-        for val in range(index):
-            if val != index - 1:
-                target = target.next
-            else:
-                next_node = target.next
-                target.next = next_node.next
+        target.next = next_node.next
+        if next_node is self._tail:
+            self._tail = target
+        self._size -= 1
+        if self._pool is not None:
+            self._pool.release(next_node)
 
     def remove(self, value: object) -> bool:
         """
@@ -177,24 +166,16 @@ class LinkedList:
         if value is None:
             return False
 
-        # CHECKS if linked list is empty
-        if self.length() == 0:
-            return False
-
-        target = self._head.next
+        target = self._head
 
         # ITERATES through list to find value and remove if found
-        for index in range(self.length()):
-
-            if target.value == value:
-                self.remove_at_index(index)
+        while target.next is not None:
+            if target.next.value == value:
+                self._unlink_after(target)
                 return True
+            target = target.next
 
-            elif target.value != value and index == self.length() - 1:
-                return False
-
-            else:
-                target = target.next
+        return False
 
     def count(self, value: object) -> int:
         """
@@ -262,22 +243,197 @@ class LinkedList:
         if start_index < 0 or start_index >= self.length():
             raise SLLException
 
-        new_ll = LinkedList(None)
-        target = self._head.next
+        new_ll = LinkedList(None, self._pool)
 
         # ITERATES through original list to reach starting index
-        for index in range(self.length() + 1):
-            if index < start_index:
-                target = target.next
+        target = self._node_before(start_index).next
 
         # ADDS values from original list to new linked list
         for val in range(size):
-            if val != size:
-                new_ll.insert_back(target.value)
-                target = target.next
+            new_ll.insert_back(target.value)
+            target = target.next
 
         return new_ll
 
+    def tail_view(self, start_index: int) -> "LinkedListView":
+        """
+        Takes an index as a parameter and returns a read-only view of the
+        values from that index to the end, sharing the list's nodes
+        instead of copying them. Changes to the list after the view is
+        made invalidate it.
+        """
+        # CHECKS if start index is valid
+        if start_index < 0 or start_index > self._size:
+            raise SLLException
+
+        first = self._node_before(start_index).next
+        return LinkedListView(first, self._size - start_index)
+
+    def sort(self, key=None, reverse: bool = False) -> None:
+        """
+        Takes an optional key function and a reverse flag as parameters
+        and sorts the list in place with a bottom-up merge sort. Only the
+        links between nodes change, so no nodes are created. The sort is
+        stable: values with equal keys keep their relative order.
+        """
+        width = 1
+        while width < self._size:
+            prev = self._head
+            target = self._head.next
+
+            # MERGES neighbouring runs of width nodes, left to right
+            while target:
+                left = target
+                right = _split_after(left, width)
+                target = _split_after(right, width)
+                prev = _merge_chains(prev, left, right, key, reverse)
+            width *= 2
+
+        # FINDS the new tail after the last merge
+        if width > 1:
+            self._tail = prev
+
+    def merge_sorted(self, other: "LinkedList", key=None) -> None:
+        """
+        Takes a second linked list sorted in ascending order (of key, if
+        given) as a parameter and splices its nodes into this sorted list
+        in linear time, leaving the second list empty. Values equal to
+        ones already in this list are placed after them.
+        """
+        if other is self:
+            raise SLLException
+
+        self._tail = _merge_chains(self._head, self._head.next,
+                                   other._head.next, key, False)
+        self._size += other._size
+        other._head.next = None
+        other._tail = other._head
+        other._size = 0
+
+
+def _split_after(node: SlottedNode, count: int) -> SlottedNode:
+    """
+    Takes the first node of a chain and a count as parameters, cuts the
+    chain after count nodes and returns the first node of the rest (None
+    if the chain is not longer than count).
+    """
+    for val in range(count - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+
+    rest = node.next
+    node.next = None
+    return rest
+
+
+def _merge_chains(prev: SlottedNode, left: SlottedNode, right: SlottedNode,
+                  key, reverse: bool) -> SlottedNode:
+    """
+    Takes a node and two sorted chains as parameters, links the merged
+    chains after the node and returns the last node of the merge. Ties
+    take the left chain first.
+    """
+    while left and right:
+        if key is None:
+            left_key, right_key = left.value, right.value
+        else:
+            left_key, right_key = key(left.value), key(right.value)
+
+        # TAKES right only if it strictly belongs before left
+        if (left_key < right_key) if reverse else (right_key < left_key):
+            prev.next = right
+            right = right.next
+        else:
+            prev.next = left
+            left = left.next
+        prev = prev.next
+
+    prev.next = left if left else right
+    while prev.next:
+        prev = prev.next
+    return prev
+
+
+class LinkedListView:
+    def __init__(self, first: SlottedNode, size: int) -> None:
+        """
+        Init a read-only view of size values of a linked list starting
+        at node first
+        """
+        self._first = first
+        self._size = size
+
+    def __str__(self) -> str:
+        """
+        Return content of the view in human-readable form
+        """
+        return 'SLL_VIEW [' + ' -> '.join(str(value) for value in self) + ']'
+
+    def __iter__(self):
+        """
+        Yields the values of the view from front to back.
+        """
+        node = self._first
+        for val in range(self._size):
+            yield node.value
+            node = node.next
+
+    def length(self) -> int:
+        """
+        Return the number of values in the view
+        """
+        return self._size
+
+    def is_empty(self) -> bool:
+        """
+        Return True is view is empty, False otherwise
+        """
+        return self._size == 0
+
+    def count(self, value: object) -> int:
+        """
+        Takes a value as a parameter and returns a count of how many
+        instances that value appears in the view.
+        """
+        count = 0
+        for item in self:
+            if item == value:
+                count += 1
+        return count
+
+    def find(self, value: object) -> bool:
+        """
+        Takes a value as a parameter and returns True if that value is
+        found in the view, returning False otherwise.
+        """
+        # CHECKS if value is provided
+        if value is None:
+            return False
+
+        for item in self:
+            if item == value:
+                return True
+        return False
+
+    def slice(self, start_index: int, size: int) -> LinkedList:
+        """
+        Takes an index and size as parameters and returns a new linked
+        list copying size values of the view from the index provided.
+        """
+        # CHECKS if size and start index are valid
+        if size < 0 or start_index + size > self._size:
+            raise SLLException
+        if start_index < 0 or start_index >= self._size:
+            raise SLLException
+
+        return LinkedList(islice(self, start_index, start_index + size))
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
 
 if __name__ == "__main__":
 
@@ -360,3 +516,44 @@ if __name__ == "__main__":
             print(" :", lst.slice(index, size))
         except:
             print(" : exception occurred.")
+
+    print("\n# tail and length example 1")
+    lst = LinkedList(range(5))
+    lst.remove_at_index(4)
+    lst.insert_back(10)
+    lst.remove(10)
+    lst.insert_at_index(4, 20)
+    lst.insert_back(30)
+    print(lst, lst.length(), lst._tail.value)
+    for value in [0, 1, 2, 3, 20, 30]:
+        lst.remove(value)
+    lst.insert_back("A")
+    print(lst, lst.length(), lst._tail.value)
+
+    print("\n# tail_view example 1")
+    lst = LinkedList([1, 2, 3, 2, 1])
+    view = lst.tail_view(2)
+    print(view, view.length(), view.count(2), view.find(1), view.find(7))
+    print(view.slice(1, 2), lst.tail_view(5), lst.tail_view(5).is_empty())
+    try:
+        lst.tail_view(6)
+    except Exception as e:
+        print(type(e))
+
+    print("\n# sort example 1")
+    lst = LinkedList([5, 2, 9, 1, 5, 6, 3])
+    lst.sort()
+    print(lst, lst.length())
+    lst.sort(reverse=True)
+    lst.insert_back(0)
+    print(lst)
+    lst = LinkedList(["pear", "fig", "apple", "kiwi", "plum"])
+    lst.sort(key=len)
+    print(lst)
+
+    print("\n# merge_sorted example 1")
+    lst = LinkedList([1, 3, 5, 7])
+    other = LinkedList([2, 3, 8])
+    lst.merge_sorted(other)
+    lst.insert_back(9)
+    print(lst, lst.length(), other, other.length())
@@ -0,0 +1,148 @@
+# Name: Josue Bustamante
+# OSU Email: bustamjo@oregonstate.edu
+# Course: CS261 - Data Structures
+# Description: A compact singly linked node declared with __slots__, so each
+#              node stores only its value and next reference instead of a
+#              per-instance __dict__, and a NodePool free-list that recycles
+#              removed nodes. The linked list, queue and stack classes build
+#              their nodes from these and accept an optional pool.
+
+
+class SlottedNode:
+    """
+    Singly linked node holding a value and a reference to the next node
+    """
+    __slots__ = ('value', 'next')
+
+    def __init__(self, value: object, next: "SlottedNode" = None) -> None:
+        self.value = value
+        self.next = next
+
+
+class NodePool:
+    def __init__(self, limit: int = 1024) -> None:
+        """
+        Initialize an empty pool that keeps at most limit released nodes
+        """
+        self._free = None
+        self._size = 0
+        self._limit = limit
+
+    def size(self) -> int:
+        """
+        Return number of released nodes waiting to be reused
+        """
+        return self._size
+
+    def acquire(self, value: object, next: SlottedNode = None) -> SlottedNode:
+        """
+        Takes a value and an optional next node as parameters and returns
+        a node holding them, reusing a released node if there is one.
+        """
+        node = self._free
+        if node is None:
+            return SlottedNode(value, next)
+
+        # TAKES the first node of the free-list
+        self._free = node.next
+        self._size -= 1
+        node.value = value
+        node.next = next
+        return node
+
+    def release(self, node: SlottedNode) -> None:
+        """
+        Takes a node that is no longer linked into any structure as a
+        parameter and keeps it for reuse, unless the pool is full. The
+        value is dropped so the pool does not keep it alive.
+        """
+        if self._size >= self._limit:
+            return
+
+        node.value = None
+        node.next = self._free
+        self._free = node
+        self._size += 1
+
+
+def new_node(pool: NodePool, value: object,
+             next: SlottedNode = None) -> SlottedNode:
+    """
+    Takes an optional pool, a value and an optional next node as parameters
+    and returns a node holding them, from the pool if one is given.
+    """
+    if pool is None:
+        return SlottedNode(value, next)
+    return pool.acquire(value, next)
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    import gc
+    import timeit
+    import tracemalloc
+
+    from queue_sll import Queue
+    from sll import LinkedList
+
+    class DictNode:
+        """
+        Node with a per-instance __dict__, like the original SLNode
+        """
+        def __init__(self, value: object, next=None) -> None:
+            self.value = value
+            self.next = next
+
+    def bytes_per_node(node_class, count: int = 100000) -> float:
+        """
+        Returns the memory traced while building a chain of count nodes,
+        divided by count (the values are shared small integers).
+        """
+        tracemalloc.start()
+        head = None
+        for value in range(count):
+            head = node_class(value & 255, head)
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return used / count
+
+    print("\n# node size benchmark")
+    dict_size = bytes_per_node(DictNode)
+    slot_size = bytes_per_node(SlottedNode)
+    print(f"__dict__ node: {dict_size:.0f} bytes per element")
+    print(f"__slots__ node: {slot_size:.0f} bytes per element")
+    print(f"saving: {1 - slot_size / dict_size:.0%}")
+
+    print("\n# linked list size benchmark")
+    tracemalloc.start()
+    lst = LinkedList(value & 255 for value in range(100000))
+    print(f"LinkedList: {tracemalloc.get_traced_memory()[0] / 100000:.0f}"
+          " bytes per element")
+    tracemalloc.stop()
+
+    print("\n# pool example 1")
+    pool = NodePool(limit=2)
+    nodes = [pool.acquire(value) for value in range(3)]
+    for node in nodes:
+        pool.release(node)
+    print(pool.size(), pool.acquire('A') is nodes[1], pool.size())
+
+    # RUNS with the garbage collector on and lst still alive, since the
+    # collections triggered by new nodes are what the pool saves
+    print("\n# queue churn benchmark")
+    for pool in [None, NodePool()]:
+        q = Queue(pool)
+
+        def churn() -> None:
+            for value in range(1000):
+                q.enqueue(value)
+            for value in range(1000):
+                q.dequeue()
+
+        seconds = min(timeit.repeat(churn, 'gc.enable()', number=50,
+                                    repeat=3, globals={'gc': gc}))
+        print("pool" if pool else "no pool", f"{seconds * 1000:.1f} ms",
+              "nodes kept:", pool.size() if pool else 0)
@@ -8,7 +8,7 @@
 #              from the top of the stack.
 
 
-from SLNode import SLNode
+from slotted_node import NodePool, new_node
 
 
 class StackException(Exception):
@@ -20,11 +20,12 @@ class StackException(Exception):
 
 
 class Stack:
-    def __init__(self) -> None:
+    def __init__(self, pool: NodePool = None) -> None:
         """
-        Initialize new stack with head node
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Initialize new stack with head node, taking nodes from the
+        optional pool and returning popped nodes to it
         """
+        self._pool = pool
         self._head = None
 
     def __str__(self) -> str:
@@ -69,15 +70,8 @@ class Stack:
         the top of the stack.
         """
 
-        # CHECKS if stack is empty
-        if self.is_empty() is True:
-            self._head = SLNode(value)
-            return
-
         # ADDS node to the top of the stack
-        next_node = self._head
-        self._head = SLNode(value)
-        self._head.next = next_node
+        self._head = new_node(self._pool, value, self._head)
 
     def pop(self) -> object:
         """
@@ -90,8 +84,11 @@ class Stack:
             raise StackException
 
         # REMOVES top of stack and returns the contained value
-        value = self._head.value
-        self._head = self._head.next
+        node = self._head
+        value = node.value
+        self._head = node.next
+        if self._pool is not None:
+            self._pool.release(node)
         return value
 
     def top(self) -> object:
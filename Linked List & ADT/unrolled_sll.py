@@ -0,0 +1,359 @@
+# Name: Josue Bustamante
+# OSU Email: bustamjo@oregonstate.edu
+# Course: CS261 - Data Structures
+# Description: An unrolled singly linked list with the same methods as
+#              LinkedList. Each node holds a list of up to node_capacity
+#              values, so walking the list follows one pointer per block of
+#              values instead of one per value, and searching and counting
+#              run inside each block. Full nodes split in half on insert and
+#              nodes less than half full borrow from or merge with the next
+#              node on removal.
+
+
+from itertools import islice
+
+from sll import SLLException
+from slotted_node import SlottedNode
+
+
+class UnrolledLinkedList:
+    def __init__(self, start_list=None, node_capacity: int = 16) -> None:
+        """
+        Initialize new unrolled linked list whose nodes hold up to
+        node_capacity values each
+        """
+        if node_capacity < 2:
+            raise SLLException
+
+        self._head = None
+        self._tail = None
+        self._size = 0
+        self._node_capacity = node_capacity
+
+        # populate list with initial values (if provided)
+        if start_list is not None:
+            self._extend(start_list)
+
+    def __str__(self) -> str:
+        """
+        Return content of the list in human-readable form, matching
+        LinkedList
+        """
+        out = 'SLL ['
+        out += ' -> '.join(str(value) for value in self)
+        out += ']'
+        return out
+
+    def __iter__(self):
+        """
+        Yields the values of the list from front to back.
+        """
+        node = self._head
+        while node:
+            yield from node.value
+            node = node.next
+
+    def length(self) -> int:
+        """
+        Return the length of the list
+        """
+        return self._size
+
+    def is_empty(self) -> bool:
+        """
+        Return True is list is empty, False otherwise
+        """
+        return self._size == 0
+
+    def node_count(self) -> int:
+        """
+        Return the number of nodes holding the values
+        """
+        count = 0
+        node = self._head
+        while node:
+            count += 1
+            node = node.next
+        return count
+
+    # ------------------------------------------------------------------ #
+
+    def _locate(self, index: int) -> tuple:
+        """
+        Takes an index of a value as a parameter and returns the node
+        before the one holding it, that node, and the offset of the value
+        in the node.
+        """
+        prev = None
+        node = self._head
+        while index >= len(node.value):
+            index -= len(node.value)
+            prev = node
+            node = node.next
+        return prev, node, index
+
+    def _split(self, node: SlottedNode) -> None:
+        """
+        Takes an overfull node as a parameter and moves the back half of
+        its values into a new node after it.
+        """
+        half = len(node.value) // 2
+        node.next = SlottedNode(node.value[half:], node.next)
+        del node.value[half:]
+        if node is self._tail:
+            self._tail = node.next
+
+    def _unlink(self, prev: SlottedNode, node: SlottedNode) -> None:
+        """
+        Takes a node and the node before it (None for the head) as
+        parameters and removes the node from the list.
+        """
+        if prev is None:
+            self._head = node.next
+        else:
+            prev.next = node.next
+        if node is self._tail:
+            self._tail = prev
+
+    def _rebalance(self, prev: SlottedNode, node: SlottedNode) -> None:
+        """
+        Takes a node that lost a value and the node before it as
+        parameters. An empty node is removed; a node less than half full
+        merges with the next node if their values fit in one node, or
+        borrows values from it otherwise.
+        """
+        if len(node.value) == 0:
+            self._unlink(prev, node)
+            return
+
+        minimum = self._node_capacity // 2
+        following = node.next
+        if len(node.value) >= minimum or following is None:
+            return
+
+        # MERGES the next node into this one
+        if len(node.value) + len(following.value) <= self._node_capacity:
+            node.value.extend(following.value)
+            self._unlink(node, following)
+            return
+
+        # BORROWS values from the front of the next node
+        count = minimum - len(node.value)
+        node.value.extend(following.value[:count])
+        del following.value[:count]
+
+    def _extend(self, values) -> None:
+        """
+        Takes an iterable as a parameter and appends its values, filling
+        the last node before adding full new ones.
+        """
+        values = iter(values)
+        while True:
+            if self._tail is not None:
+                room = self._node_capacity - len(self._tail.value)
+                block = list(islice(values, room))
+                self._tail.value.extend(block)
+                self._size += len(block)
+                if len(block) < room:
+                    return
+
+            block = list(islice(values, self._node_capacity))
+            if not block:
+                return
+            node = SlottedNode(block)
+            if self._tail is None:
+                self._head = node
+            else:
+                self._tail.next = node
+            self._tail = node
+            self._size += len(block)
+
+    def get_at_index(self, index: int) -> object:
+        """
+        Takes an index as a parameter and returns the value at that index.
+        """
+        if index >= self._size or index < 0:
+            raise SLLException
+
+        prev, node, offset = self._locate(index)
+        return node.value[offset]
+
+    def insert_front(self, value: object) -> None:
+        """
+        Takes a value as a parameter and inserts it at the front of the
+        list.
+        """
+        self.insert_at_index(0, value)
+
+    def insert_back(self, value: object) -> None:
+        """
+        Takes a value as a parameter and inserts it at the back of the
+        list.
+        """
+        # ADDS a new node if the last one is full
+        if self._tail is None or \
+                len(self._tail.value) >= self._node_capacity:
+            node = SlottedNode([value])
+            if self._tail is None:
+                self._head = node
+            else:
+                self._tail.next = node
+            self._tail = node
+        else:
+            self._tail.value.append(value)
+        self._size += 1
+
+    def insert_at_index(self, index: int, value: object) -> None:
+        """
+        Takes an index and value as parameters and inserts the value at
+        the index specified.
+        """
+        # CHECKS if index is invalid
+        if index > self._size or index < 0:
+            raise SLLException
+
+        # CHECKS if value will be inserted at back of list
+        if index == self._size:
+            self.insert_back(value)
+            return
+
+        prev, node, offset = self._locate(index)
+        node.value.insert(offset, value)
+        self._size += 1
+        if len(node.value) > self._node_capacity:
+            self._split(node)
+
+    def remove_at_index(self, index: int) -> None:
+        """
+        Takes an index as a parameter and removes the value at the index
+        specified.
+        """
+        # CHECKS if index is invalid
+        if index >= self._size or index < 0:
+            raise SLLException
+
+        prev, node, offset = self._locate(index)
+        del node.value[offset]
+        self._size -= 1
+        self._rebalance(prev, node)
+
+    def remove(self, value: object) -> bool:
+        """
+        Takes a value as a parameter and removes its first instance,
+        returning True if the procedure was successful and False
+        otherwise.
+        """
+        # CHECKS if value is invalid
+        if value is None:
+            return False
+
+        prev = None
+        node = self._head
+
+        # SEARCHES each node's values for the value
+        while node:
+            if value in node.value:
+                node.value.remove(value)
+                self._size -= 1
+                self._rebalance(prev, node)
+                return True
+            prev = node
+            node = node.next
+
+        return False
+
+    def count(self, value: object) -> int:
+        """
+        Takes a value as a parameter and returns a count of how many
+        instances that value appears in the list.
+        """
+        count = 0
+        node = self._head
+        while node:
+            count += node.value.count(value)
+            node = node.next
+        return count
+
+    def find(self, value: object) -> bool:
+        """
+        Takes a value as a parameter and returns True if that value is
+        found in the list, returning False otherwise.
+        """
+        # CHECKS if value is provided
+        if value is None:
+            return False
+
+        node = self._head
+        while node:
+            if value in node.value:
+                return True
+            node = node.next
+        return False
+
+    def slice(self, start_index: int, size: int) -> "UnrolledLinkedList":
+        """
+        Takes an index and size as parameters and returns a new list of
+        the size specified holding the values starting from the index
+        provided.
+        """
+        # CHECKS if size is valid
+        if size < 0 or start_index + size > self._size:
+            raise SLLException
+
+        # CHECKS if start index is valid
+        if start_index < 0 or start_index >= self._size:
+            raise SLLException
+
+        prev, node, offset = self._locate(start_index)
+
+        def values():
+            block = node
+            yield from islice(block.value, offset, None)
+            block = block.next
+            while block:
+                yield from block.value
+                block = block.next
+
+        return UnrolledLinkedList(islice(values(), size),
+                                  self._node_capacity)
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    import timeit
+
+    from sll import LinkedList
+
+    print("\n# unrolled list example 1")
+    lst = UnrolledLinkedList(range(10), node_capacity=4)
+    print(lst, lst.length(), lst.node_count())
+    lst.insert_at_index(1, "A")
+    lst.insert_front("B")
+    lst.insert_back("C")
+    print(lst, lst.length(), lst.node_count())
+    for index in [0, 0, 0, 5, 5, 5]:
+        lst.remove_at_index(index)
+    print(lst, lst.length(), lst.node_count(), lst.get_at_index(3))
+
+    print("\n# unrolled list example 2")
+    lst = UnrolledLinkedList([1, 2, 3, 1, 2, 3, 1, 2, 3], node_capacity=2)
+    print(lst.count(2), lst.find(3), lst.find(7), lst.remove(7))
+    for value in [3, 3, 3, 3]:
+        print(lst.remove(value), lst)
+    print(lst.slice(1, 3), lst.node_count())
+    for index, size in [(-1, 2), (0, 7), (5, 1)]:
+        try:
+            lst.slice(index, size)
+        except Exception as e:
+            print("Exception:", type(e))
+
+    print("\n# traversal benchmark")
+    values = list(range(100000))
+    for cls in [LinkedList, UnrolledLinkedList]:
+        lst = cls(values)
+        seconds = min(timeit.repeat(lambda: lst.count(-1), number=5,
+                                    repeat=3))
+        print(cls.__name__, f"count: {seconds * 1000:.1f} ms")
